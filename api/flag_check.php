@@ -6,7 +6,12 @@
  * by the Python client to check for new flags without freezing the UI.
  *
  * GET - Check for unacknowledged flags for the authenticated user
+ *       Every response carries the etag of the flag set. With ?since=<etag>
+ *       matching the current set, the response is {"unchanged": true} without
+ *       the flags list. Requests are always answered immediately.
  * POST - Acknowledge a flag (mark as viewed)
+ *        {"type": ..., "id": N} acknowledges one flag,
+ *        {"type": ..., "ids": [N, ...]} acknowledges several in one request
  */
 
 header('Content-Type: application/json');
@@ -27,16 +32,42 @@ $db = Database::getInstance();
 $method = $_SERVER['REQUEST_METHOD'];
 $username = $user['username'];
 
+/**
+ * Identify a flag set by the flags it contains
+ */
+function flagSetEtag(array $flags) {
+    $parts = [];
+    foreach ($flags as $flag) {
+        $parts[] = ($flag['flag_type'] ?? '') . ':' . ($flag['id'] ?? '');
+    }
+    return md5(implode(',', $parts));
+}
+
 // GET - Check for unacknowledged flags (lightweight query)
 if ($method === 'GET') {
+    $since = (string)($_GET['since'] ?? '');
+
     try {
-        // Get count of unacknowledged flags for this user
+        // Get unacknowledged flags for this user
         $flags = $db->getUnacknowledgedFlags($username);
+        $etag = flagSetEtag($flags);
+
+        if ($since !== '' && $etag === $since) {
+            // Same flag set the client already has - skip resending it
+            echo json_encode([
+                'success' => true,
+                'unchanged' => true,
+                'count' => count($flags),
+                'etag' => $etag
+            ]);
+            exit;
+        }
 
         echo json_encode([
             'success' => true,
             'count' => count($flags),
-            'flags' => $flags
+            'flags' => $flags,
+            'etag' => $etag
         ]);
     } catch (Exception $e) {
         http_response_code(500);
@@ -57,16 +88,23 @@ if ($method === 'POST') {
     }
 
     $flagType = $data['type'] ?? '';  // 'retest' or 'fixed'
+    $flagIds = isset($data['ids']) && is_array($data['ids'])
+        ? array_values(array_filter(array_map('intval', $data['ids'])))
+        : [];
     $flagId = intval($data['id'] ?? 0);
 
-    if (!$flagType || !$flagId) {
+    if (!$flagType || (!$flagId && empty($flagIds))) {
         http_response_code(400);
         echo json_encode(['error' => 'Missing type or id parameter']);
         exit;
     }
 
     try {
-        $result = $db->acknowledgeFlagNotification($flagType, $flagId, $username);
+        if (!empty($flagIds)) {
+            $result = $db->acknowledgeFlagNotifications($flagType, $flagIds, $username);
+        } else {
+            $result = $db->acknowledgeFlagNotification($flagType, $flagId, $username);
+        }
 
         if ($result) {
             echo json_encode([
@@ -2,6 +2,9 @@
 /**
  * API endpoint for retest queue
  * Clients query this to check if there are tests they need to retest
+ *
+ * GET responses carry an ETag of the body; a request whose If-None-Match
+ * matches it gets 304 Not Modified with no body.
  */
 
 header('Content-Type: application/json');
@@ -34,11 +37,22 @@ if ($method === 'GET') {
         $item['test_name'] = $testKeys[$item['test_key']] ?? 'Unknown Test';
     }
 
-    echo json_encode([
+    $body = json_encode([
         'success' => true,
         'count' => count($queue),
         'retest_queue' => $queue
     ]);
+
+    // Let polling clients skip re-downloading an unchanged queue
+    $etag = '"' . md5($body) . '"';
+    header('ETag: ' . $etag);
+    $ifNoneMatch = $_SERVER['HTTP_IF_NONE_MATCH'] ?? '';
+    if ($ifNoneMatch !== '' && in_array($etag, array_map('trim', explode(',', $ifNoneMatch)), true)) {
+        http_response_code(304);
+        exit;
+    }
+
+    echo $body;
     exit;
 }
 
@@ -29,8 +29,22 @@ if (!$authenticatedUser) {
     exit;
 }
 
-// Get JSON body
+// Get JSON body (the test tool gzip-compresses large submissions).
+// Encoding problems answer 415 so clients can tell them apart from invalid reports (400)
 $rawBody = file_get_contents('php://input');
+$contentEncoding = strtolower(trim($_SERVER['HTTP_CONTENT_ENCODING'] ?? ''));
+if ($contentEncoding === 'gzip') {
+    $rawBody = @gzdecode($rawBody);
+    if ($rawBody === false) {
+        http_response_code(415);
+        echo json_encode(['error' => 'Invalid gzip-encoded request body']);
+        exit;
+    }
+} elseif ($contentEncoding !== '' && $contentEncoding !== 'identity') {
+    http_response_code(415);
+    echo json_encode(['error' => 'Unsupported Content-Encoding: ' . $contentEncoding]);
+    exit;
+}
 $json = json_decode($rawBody, true);
 
 if (json_last_error() !== JSON_ERROR_NONE) {
@@ -4040,6 +4040,38 @@ class Database {
         }
     }
 
+    /**
+     * Acknowledge several flag notifications of one type for a user in a single insert
+     */
+    public function acknowledgeFlagNotifications($flagType, array $flagIds, $username) {
+        $this->ensureFlagAcknowledgementsTable();
+
+        if (!in_array($flagType, ['retest', 'fixed'])) {
+            return false;
+        }
+
+        $flagIds = array_values(array_unique(array_filter(array_map('intval', $flagIds))));
+        if (empty($flagIds)) {
+            return false;
+        }
+
+        try {
+            $placeholders = implode(',', array_fill(0, count($flagIds), '(?, ?, ?)'));
+            $params = [];
+            foreach ($flagIds as $flagId) {
+                array_push($params, $flagType, $flagId, $username);
+            }
+            $stmt = $this->pdo->prepare("
+                INSERT IGNORE INTO flag_acknowledgements (flag_type, flag_id, username)
+                VALUES $placeholders
+            ");
+            $stmt->execute($params);
+            return true; // Success even if some were already acknowledged
+        } catch (PDOException $e) {
+            return false;
+        }
+    }
+
     /**
      * Check if a flag has been acknowledged by a user
      */
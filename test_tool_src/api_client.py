@@ -39,6 +39,7 @@ from datetime import datetime
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Error: 'requests' library is required. Install with: pip install requests")
     sys.exit(1)
@@ -50,6 +51,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger('TestPanelClient')
 
+# Request bodies at least this large are gzip-compressed when compression is requested
+COMPRESS_MIN_BYTES = 1024
+
+# Bytes read per step while streaming a log file through zlib in compress_log_file
+LOG_READ_CHUNK_BYTES = 64 * 1024
+
+# Keep-alive pool for the client's HTTP session: hosts cached, and connections kept per host
+# (the API worker, flag polling and main thread may each hold one)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+
 
 def convert_html_code_blocks_to_markdown(text: str) -> str:
     """
@@ -1026,6 +1038,12 @@ class TestPanelClient:
         self._is_online = False
         self._online_callbacks: List[Callable[[bool], None]] = []
 
+        # One session for all requests so TCP/TLS connections are reused
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Validate configuration
         errors = config.validate()
         if errors:
@@ -1100,7 +1118,9 @@ class TestPanelClient:
         }
 
     def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None,
-                      params: Optional[dict] = None) -> requests.Response:
+                      params: Optional[dict] = None, compress: bool = False,
+                      timeout: Optional[float] = None,
+                      extra_headers: Optional[dict] = None) -> requests.Response:
         """
         Make an API request.
 
@@ -1109,25 +1129,68 @@ class TestPanelClient:
             endpoint: API endpoint path
             data: Optional JSON data for POST requests
             params: Optional query parameters
+            compress: If True, gzip the JSON body (Content-Encoding: gzip) when it is large
+            timeout: Optional request timeout in seconds (defaults to config.timeout)
+            extra_headers: Optional headers added to the defaults
 
         Returns:
             Response object
         """
         url = f"{self.config.api_url}/{endpoint.lstrip('/')}"
 
+        headers = self._get_headers()
+        if extra_headers:
+            headers.update(extra_headers)
         kwargs = {
-            'headers': self._get_headers(),
-            'timeout': self.config.timeout,
+            'headers': headers,
+            'timeout': timeout if timeout is not None else self.config.timeout,
         }
 
         if params:
             kwargs['params'] = params
         if data:
-            kwargs['json'] = data
+            if compress:
+                body = json.dumps(data).encode('utf-8')
+                if len(body) >= COMPRESS_MIN_BYTES:
+                    body = gzip.compress(body, compresslevel=6)
+                    headers['Content-Encoding'] = 'gzip'
+                kwargs['data'] = body
+            else:
+                kwargs['json'] = data
 
-        response = requests.request(method, url, **kwargs)
+        response = self.session.request(method, url, **kwargs)
         return response
 
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def _post_report(self, data: dict) -> requests.Response:
+        """
+        POST report data to the submit endpoint with a gzip-compressed body.
+
+        A compressed request is retried uncompressed only when the server
+        didn't understand the encoding: 415 from current panels, or the 400
+        'Invalid JSON' error older panels give for a gzip body. Other 400s are
+        ordinary validation failures and are returned as-is.
+        """
+        response = self._make_request('POST', '/api/submit.php', data=data, compress=True)
+        if (response.request.headers.get('Content-Encoding') == 'gzip'
+                and (response.status_code == 415
+                     or (response.status_code == 400 and self._is_invalid_json_error(response)))):
+            logger.info("Server rejected compressed submission, retrying uncompressed")
+            response = self._make_request('POST', '/api/submit.php', data=data)
+        return response
+
+    @staticmethod
+    def _is_invalid_json_error(response: requests.Response) -> bool:
+        """True if a 400 response is submit.php's 'Invalid JSON' body parse error."""
+        try:
+            error = response.json().get('error', '')
+        except ValueError:
+            return False
+        return isinstance(error, str) and error.startswith('Invalid JSON')
+
     def submit_report(self, file_path: str, verbose: bool = False,
                       queue_if_offline: bool = True) -> SubmitResult:
         """
@@ -1168,7 +1231,7 @@ class TestPanelClient:
 
         # Try to submit to API
         try:
-            response = self._make_request('POST', '/api/submit.php', data=data)
+            response = self._post_report(data)
 
             try:
                 result = response.json()
@@ -1247,7 +1310,7 @@ class TestPanelClient:
         data = prepare_data_for_api(data)
 
         try:
-            response = self._make_request('POST', '/api/submit.php', data=data)
+            response = self._post_report(data)
 
             try:
                 result = response.json()
@@ -1411,12 +1474,35 @@ class TestPanelClient:
         Returns:
             List of RetestItem objects
         """
+        items, _ = self.get_retest_queue_if_changed(client_version=client_version)
+        return items
+
+    def get_retest_queue_if_changed(self, etag: Optional[str] = None,
+                                    client_version: Optional[str] = None) -> tuple:
+        """
+        Get the retest queue unless it is unchanged since the response tagged etag.
+
+        Args:
+            etag: ETag from a previous call; sent as If-None-Match
+            client_version: Optional filter by client version
+
+        Returns:
+            (items, etag) tuple. items is None when the server answered
+            304 Not Modified, and [] on errors. etag is the queue's ETag
+            for the next call (None if the panel doesn't send one).
+        """
         params = {}
         if client_version:
             params['client_version'] = client_version
+        extra_headers = {'If-None-Match': etag} if etag else None
 
         try:
-            response = self._make_request('GET', '/api/retests.php', params=params)
+            response = self._make_request('GET', '/api/retests.php', params=params,
+                                          extra_headers=extra_headers)
+
+            if response.status_code == 304:
+                self._last_retest_check = datetime.now()
+                return None, etag
 
             if response.status_code == 200:
                 data = response.json()
@@ -1424,26 +1510,33 @@ class TestPanelClient:
                     items = [RetestItem.from_dict(item) for item in data.get('retest_queue', [])]
                     self._cached_retests = items
                     self._last_retest_check = datetime.now()
-                    return items
+                    return items, response.headers.get('ETag')
 
             logger.warning(f"Failed to get retest queue: HTTP {response.status_code}")
-            return []
+            return [], None
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching retest queue: {e}")
-            return []
+            return [], None
 
-    def check_flags(self) -> dict:
+    def check_flags(self, since: Optional[str] = None) -> dict:
         """
         Lightweight flag check for polling - checks for unacknowledged flags.
 
         This is a low-overhead call designed for periodic background polling.
 
+        Args:
+            since: Etag of the flag set from the previous response; if the set is
+                   unchanged the panel answers without resending the flags
+
         Returns:
-            Dict with 'success', 'count', and 'flags' keys
+            Dict with 'success', 'count', 'flags', 'etag' and 'unchanged' keys.
+            'unchanged' is True (and 'flags' empty) when the set still matches
+            `since`; 'etag' is None when the panel does not send one.
         """
         try:
-            response = self._make_request('GET', '/api/flag_check.php')
+            params = {'since': since} if since else None
+            response = self._make_request('GET', '/api/flag_check.php', params=params)
 
             if response.status_code == 200:
                 data = response.json()
@@ -1451,7 +1544,9 @@ class TestPanelClient:
                     return {
                         'success': True,
                         'count': data.get('count', 0),
-                        'flags': data.get('flags', [])
+                        'flags': data.get('flags', []),
+                        'etag': data.get('etag'),
+                        'unchanged': bool(data.get('unchanged'))
                     }
                 return {'success': False, 'count': 0, 'flags': [], 'error': data.get('error', 'Unknown error')}
 
@@ -1488,6 +1583,47 @@ class TestPanelClient:
             logger.error(f"Error acknowledging flag: {e}")
             return False
 
+    def acknowledge_flags(self, flag_type: str, flag_ids: List[int]) -> bool:
+        """
+        Acknowledge several flag notifications of one type in a single request.
+
+        Panels that predate batch acknowledgement reject the request with a 400;
+        the flags are then acknowledged one at a time.
+
+        Args:
+            flag_type: 'retest' or 'fixed'
+            flag_ids: The flags' IDs
+
+        Returns:
+            True if all flags were acknowledged successfully
+        """
+        flag_ids = [flag_id for flag_id in flag_ids if flag_id]
+        if not flag_ids:
+            return True
+        if len(flag_ids) == 1:
+            return self.acknowledge_flag(flag_type, flag_ids[0])
+
+        try:
+            response = self._make_request('POST', '/api/flag_check.php', data={
+                'type': flag_type,
+                'ids': flag_ids
+            })
+
+            if response.status_code == 200:
+                data = response.json()
+                return data.get('success', False)
+
+            if response.status_code not in (400, 404):
+                return False
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error acknowledging flags: {e}")
+            return False
+
+        # Older panel without batch support
+        results = [self.acknowledge_flag(flag_type, flag_id) for flag_id in flag_ids]
+        return all(results)
+
     def get_tests(self, enabled_only: bool = True, client_version: Optional[str] = None,
                   use_cache: bool = True) -> TestsResult:
         """
@@ -2054,15 +2190,19 @@ class TestPanelClient:
         import zlib
         from datetime import datetime
 
+        # Stream the file through zlib so the uncompressed log is never held in memory in full
+        compressor = zlib.compressobj(9)
+        compressed = bytearray()
+        size_original = 0
         with open(file_path, 'rb') as f:
-            content = f.read()
-
-        size_original = len(content)
-        compressed = zlib.compress(content, 9)
+            file_stat = os.fstat(f.fileno())
+            for chunk in iter(lambda: f.read(LOG_READ_CHUNK_BYTES), b''):
+                size_original += len(chunk)
+                compressed += compressor.compress(chunk)
+        compressed += compressor.flush()
         size_compressed = len(compressed)
 
         # Get file modification time
-        file_stat = os.stat(file_path)
         file_datetime = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
 
         return {
@@ -6,6 +6,7 @@ import base64
 import gzip
 import html as html_lib
 import shutil
+import tempfile
 import io
 import tokenize
 import keyword
@@ -13,16 +14,19 @@ import configparser
 import hashlib
 import threading
 import math
+import time
+import functools
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, QLineEdit,
                              QPushButton, QFileDialog, QCheckBox, QStackedWidget, QListWidget,
                              QListWidgetItem, QHBoxLayout, QTextEdit, QMessageBox, QScrollArea, QFrame,
-                             QButtonGroup, QRadioButton, QDialog, QGroupBox, QComboBox, QShortcut,
-                             QProgressBar, QSizePolicy, QStyledItemDelegate, QStyle)
-from PyQt5.QtCore import QDate, QUrl, Qt, QTimer, QSize
+                             QDialog, QGroupBox, QComboBox, QShortcut,
+                             QProgressBar, QProgressDialog, QSizePolicy, QStyledItemDelegate, QStyle)
+from PyQt5.QtCore import QDate, QUrl, Qt, QTimer, QSize, QRect
 from PyQt5.QtGui import (QPixmap, QImage, QDesktopServices, QTextCursor, QColor, QKeySequence,
-                          QTextCharFormat, QPalette, QFont, QFontMetrics)
+                          QTextCharFormat, QPalette, QFont, QFontMetrics, QPen, QPainter)
 from versions import VERSIONS
 
 # Try to import panel integration (optional - only if configured)
@@ -46,11 +50,177 @@ except ImportError:
     VersionNotification = None
     VersionsResult = None
 
+# Try to import orjson for faster JSON serialization (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Seconds a successful server hash check stays valid when nothing changed locally
+SERVER_HASH_CHECK_TTL = 300
+
+# Delay before a scheduled session save is flushed to disk
+SESSION_SAVE_DEBOUNCE_MS = 500
+
+# session['schema_version'] written by this tool; sessions at this version
+# need no load-time migration (1: legacy test 12 notes moved to 12a)
+SESSION_SCHEMA_VERSION = 1
+
+# gzip level for attached logs: most of level 9's ratio on text logs at a fraction of its CPU time
+LOG_COMPRESS_LEVEL = 6
+# Characters read per step while streaming a log file into gzip
+LOG_COMPRESS_CHUNK_CHARS = 64 * 1024
+
+# Seconds a panel report-id / report-logs lookup is reused by the test page
+REPORT_LOOKUP_CACHE_TTL = 60
+
+# steam_date / steam_time lines in the emulator ini; tolerate leading/trailing
+# whitespace around the key and '=', and any existing value (2004/10/01, 00:00:01, ...)
+EMULATOR_INI_DATE_PATTERN = re.compile(r'^(?P<prefix>\s*steam_date\s*=\s*).*$', re.MULTILINE)
+EMULATOR_INI_TIME_PATTERN = re.compile(r'^(?P<prefix>\s*steam_time\s*=\s*).*$', re.MULTILINE)
+
+# Package name prefix -> session['version_packages'] field it sets.
+# Platform packages are equivalent to SteamUI for early versions.
+PACKAGE_PREFIX_FIELDS = {
+    'Steam': 'steam_pkg_version',
+    'SteamUI': 'steamui_version',
+    'Platform': 'steamui_version',
+}
+
+# Flag notifications: polling interval, and the longest it backs off to while
+# the panel reports the flag set unchanged
+FLAG_POLL_INTERVAL = 30
+FLAG_POLL_MAX_INTERVAL = 120
+
+# Version-specific test lists kept in memory (least recently used evicted first).
+# The cache never holds fewer entries than there are active versions, so a
+# report walking every tested version does not evict its own lookups.
+VERSION_TESTS_CACHE_SIZE = 32
+VERSION_TESTS_CACHE_TTL = 300
+# Seconds a failed version-specific test lookup is remembered before retrying
+VERSION_TESTS_FAILURE_TTL = 10
+
+# Static start of the HTML report: document head with the report stylesheet
+REPORT_HEAD_HTML = (
+    "<html><head><meta charset='utf-8'><title>Steam Emulator Test Report</title>\n"
+    "<style>"
+    "body{font-family:Segoe UI,Arial,sans-serif;font-size:14px;color:#222;line-height:1.35;margin:20px}"
+    "h1{font-size:22px;margin:0 0 8px}"
+    "h2{font-size:18px;margin:18px 0 6px}"
+    "p{margin:4px 0 8px}"
+    "table{border-collapse:collapse;width:100%;font-size:13px}"
+    "th,td{border:1px solid #ccc;padding:6px;vertical-align:top}"
+    "th{background:#f5f5f5;text-align:left}"
+    ".meta{font-size:13px;color:#666}"
+    ".notes{font-size:13px;line-height:1.35}"
+    ".notes *{font-size:inherit !important;line-height:inherit}"
+    ".notes pre{background:#fdf6e3;color:#333;font-family:Consolas,'Courier New',monospace;font-size:12px;line-height:1.4;padding:8px;border-radius:6px;white-space:pre-wrap;overflow-x:auto;margin:6px 0}"
+    ".notes pre code{font-size:inherit;background:none;padding:0}"
+    ".notes img{max-width:125px;height:auto;cursor:pointer;border:1px solid #ccc;border-radius:3px}"
+    "details.version{border:1px solid #e5e5e5;border-radius:6px;padding:10px;margin:12px 0;background:#fafafa}"
+    "details.version[open]{background:#fff}"
+    "details.version summary{cursor:pointer;font-weight:600;font-size:15px;list-style:none}"
+    "details.version summary::-webkit-details-marker{display:none}"
+    "details.version summary:before{content:'▸';display:inline-block;margin-right:6px;color:#666}"
+    "details.version[open] summary:before{content:'▾'}"
+    ".matrix-wrap{overflow:auto;max-width:100%;margin-top:6px}"
+    ".matrix th{position:sticky;top:0;background:#fff;z-index:2}"
+    ".matrix th:first-child{left:0;z-index:3}"
+    ".matrix .row-label{background:#f9f9f9;white-space:nowrap;position:sticky;left:0;z-index:1}"
+    ".matrix .cell{width:24px;height:18px;border:1px solid #ccc}"
+    ".matrix .cell-empty{background:#fff;border:1px solid #eee}"
+    ".matrix .cell-link{display:block;width:100%;height:100%;text-decoration:none}"
+    ".legend{margin-top:8px;display:flex;gap:12px;align-items:center;font-size:13px}"
+    ".legend-item{display:flex;gap:6px;align-items:center}"
+    ".legend-swatch{width:18px;height:12px;border:1px solid #ccc}"
+    "</style>\n"
+    "</head><body>\n"
+)
+
+# Image lightbox for the HTML report: data:image thumbnails open in a popup
+REPORT_MODAL_HTML = (
+    "<div id=\"imgModal\" style=\"display:none;position:fixed;z-index:9999;left:0;top:0;width:100%;height:100%;overflow:auto;background-color:rgba(0,0,0,0.8);text-align:center\">"
+    "<span style=\"position:absolute;right:20px;top:20px;color:#fff;font-size:30px;cursor:pointer\" onclick=\"document.getElementById('imgModal').style.display='none'\">&times;</span>"
+    "<img id=\"imgModalImg\" src=\"\" style=\"max-width:90%;max-height:90%;margin-top:3%;cursor:pointer\"/>"
+    "</div>\n"
+    "<script>"
+    # open data:image modal when clicking anchors to embedded images
+    "document.addEventListener('click',function(e){"
+    "var a=e.target.closest&&e.target.closest('a');"
+    "if(!a)return;"
+    "var href=a.getAttribute&&a.getAttribute('href');"
+    "if(href&&href.indexOf('data:image')===0){"
+    "e.preventDefault();"
+    "document.getElementById('imgModalImg').src=href;"
+    "document.getElementById('imgModal').style.display='block';"
+    "}"
+    "});"
+    # clicking the full image closes the modal
+    "document.getElementById('imgModalImg').addEventListener('click',function(){"
+    "document.getElementById('imgModal').style.display='none';"
+    "});"
+    "</script>\n"
+)
+
+# Status colour legend shown under the report's test matrix
+REPORT_LEGEND_HTML = (
+    '<div class="legend">\n'
+    '<div class="legend-item"><div class="legend-swatch" style="background:#3498db"></div><div>Working</div></div>\n'
+    '<div class="legend-item"><div class="legend-swatch" style="background:#f1c40f"></div><div>Semi-working</div></div>\n'
+    '<div class="legend-item"><div class="legend-swatch" style="background:#e74c3c"></div><div>Not working</div></div>\n'
+    '<div class="legend-item"><div class="legend-swatch" style="background:#95a5a6"></div><div>N/A / Skipped</div></div>\n'
+    '</div>\n'
+)
+
+# Write buffer for exported report files; fragments are written straight to the file
+REPORT_WRITE_BUFFER = 1 << 20
+
 # API-loaded versions list (populated from API when available)
 # Format: list of dicts with id, packages, steam_date, steam_time (skip_tests deprecated, use templates)
 API_VERSIONS = None  # None means not loaded; empty list means loaded but empty
 
 
+def result_error(result):
+    """Error text for a failed panel callback; result is a *Result object or an error string."""
+    if isinstance(result, str):
+        return result or "Unknown error"
+    if result is None:
+        return "Unknown error"
+    return result.error or str(result)
+
+
+def dump_json_bytes(data):
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS: stringify non-str dict keys like the json module does
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def atomic_write_bytes(path, data, fsync=False):
+    """Write bytes to path via a sibling .tmp file and os.replace, so readers never see a partial file.
+
+    With fsync=True the data is flushed to disk before the rename, so a crash
+    leaves either the old or the new file rather than an empty one.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def get_active_versions():
     """Get the currently active versions list (API versions if loaded, else fallback)."""
     global API_VERSIONS
@@ -96,7 +266,8 @@ def get_version_notifications_for_display(version_id, commit_hash=None):
                     'name': n.name,
                     'message': n.message,
                     'commit_hash': n.commit_hash,
-                    'created_at': n.created_at
+                    'created_at': n.created_at,
+                    'created_by': n.created_by
                 })
 
     return result
@@ -120,9 +291,13 @@ def get_version_storage_key(vid, commit_hash=None):
     return vid
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_version_storage_key(storage_key):
     """Parse a storage key into version ID and commit hash.
 
+    Results are memoized; storage keys are short strings that are parsed
+    repeatedly during uploads and page refreshes.
+
     Args:
         storage_key: Storage key (either 'vid' or 'vid|commit')
 
@@ -531,6 +706,10 @@ FALLBACK_TESTS = [
 TESTS = list(FALLBACK_TESTS)
 
 STATUS_OPTIONS = ["", "Working", "Semi-working", "Not working", "N/A"]
+# Statuses a tester can pick (STATUS_OPTIONS without the empty "unset" entry)
+STATUS_OPTS_UI = tuple(STATUS_OPTIONS[1:])
+# Selectable status text -> segment index in a StatusSelector
+STATUS_SEGMENT_INDEX = {opt: i for i, opt in enumerate(STATUS_OPTS_UI)}
 
 
 def prepare_notes_for_editor(notes: str) -> str:
@@ -695,6 +874,21 @@ def escape_html_php(text: str) -> str:
     return result.replace('&#x27;', '&#039;')
 
 
+# Matches [b]/[i]/[u] BBCode tags (open or close) and newlines in one pass
+BBCODE_PATTERN = re.compile(r'\[(/?)([biu])\]|\n')
+
+
+def _bbcode_replace(match):
+    if match.group(2) is None:
+        return '<br>'
+    return f"<{match.group(1)}{match.group(2)}>"
+
+
+def bbcode_to_html(text: str) -> str:
+    """Convert basic BBCode formatting ([b], [i], [u]) and newlines to HTML."""
+    return BBCODE_PATTERN.sub(_bbcode_replace, text)
+
+
 def normalize_notes_for_hash(notes: str) -> str:
     """
     Normalize notes to a canonical format for hash comparison.
@@ -781,6 +975,30 @@ def convert_markdown_code_blocks_to_html(text: str) -> str:
     return re.sub(code_block_pattern, replace_code_block, text)
 
 
+# Runs of characters that are not allowed in HTML report anchor ids
+REPORT_ANCHOR_PATTERN = re.compile(r'[^a-zA-Z0-9_-]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def report_anchor_id(value):
+    """Anchor id fragment for a version id or test key in the HTML report."""
+    return REPORT_ANCHOR_PATTERN.sub('-', str(value)).strip('-').lower()
+
+
+# Notes containing any of these are already HTML and go into the report as-is
+REPORT_HTML_NOTES_PATTERN = re.compile(r'<(?:img|pre|code|p|br)|&lt;')
+
+# Plain-text notes -> report HTML in one pass: html.escape() plus newlines as <br>
+REPORT_NOTES_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+    '\n': '<br>',
+})
+
+
 def clean_notes(notes: str) -> str:
     """
     Clean notes text to match PHP's cleanNotes() function.
@@ -1073,12 +1291,24 @@ def find_and_compress_log_files(emulator_path, packages, max_hours=13):
     compressed_logs = []
     for file_datetime, filename, file_path in found_logs:
         try:
-            # Read the log file
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                log_content = f.read()
-
-            # Compress with gzip
-            compressed = gzip.compress(log_content.encode('utf-8'))
+            # Stream the log through gzip in fixed-size chunks so the decoded
+            # text is never held in memory in full
+            size_original = 0
+            sink = io.BytesIO()
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f, \
+                    gzip.GzipFile(fileobj=sink, mode='wb', compresslevel=LOG_COMPRESS_LEVEL) as gz:
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+                while True:
+                    chunk = f.read(LOG_COMPRESS_CHUNK_CHARS)
+                    if not chunk:
+                        break
+                    size_original += len(chunk)
+                    gz.write(chunk.encode('utf-8'))
+            compressed = sink.getvalue()
 
             # Base64 encode for JSON transport
             b64_compressed = base64.b64encode(compressed).decode('ascii')
@@ -1086,7 +1316,7 @@ def find_and_compress_log_files(emulator_path, packages, max_hours=13):
             compressed_logs.append({
                 'filename': filename,
                 'datetime': file_datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                'size_original': len(log_content),
+                'size_original': size_original,
                 'size_compressed': len(compressed),
                 'data': b64_compressed
             })
@@ -1180,6 +1410,17 @@ class IntroPage(QWidget):
 
         self.browse_btn.clicked.connect(self.browse)
 
+        # get_metadata() result is cached until any of its source widgets change
+        self._metadata_cache = None
+        for line_edit in (self.name_input, self.path_input, self.api_url_input, self.api_key_input):
+            line_edit.textChanged.connect(self._invalidate_metadata)
+        self.commit_input.currentTextChanged.connect(self._invalidate_metadata)
+        for checkbox in (self.wan_cb, self.lan_cb, self.load_from_api_cb):
+            checkbox.toggled.connect(self._invalidate_metadata)
+
+    def _invalidate_metadata(self, *args):
+        self._metadata_cache = None
+
     def browse(self):
         d = QFileDialog.getExistingDirectory(self, "Select emulator folder")
         if d:
@@ -1334,18 +1575,21 @@ class IntroPage(QWidget):
         self.commit_input.setCurrentText(sha)
 
     def get_metadata(self):
-        # Get the commit SHA (just the hash, not the datetime display)
-        commit_sha = self.get_commit_sha()
-        return {
-            'tester': self.name_input.text(),
-            'commit': commit_sha,
-            'emulator_path': self.path_input.text(),
-            'WAN': self.wan_cb.isChecked(),
-            'LAN': self.lan_cb.isChecked(),
-            'api_url': self.api_url_input.text(),
-            'api_key': self.api_key_input.text(),
-            'load_from_api': self.load_from_api_cb.isChecked(),
-        }
+        if self._metadata_cache is None:
+            # Get the commit SHA (just the hash, not the datetime display)
+            commit_sha = self.get_commit_sha()
+            self._metadata_cache = {
+                'tester': self.name_input.text(),
+                'commit': commit_sha,
+                'emulator_path': self.path_input.text(),
+                'WAN': self.wan_cb.isChecked(),
+                'LAN': self.lan_cb.isChecked(),
+                'api_url': self.api_url_input.text(),
+                'api_key': self.api_key_input.text(),
+                'load_from_api': self.load_from_api_cb.isChecked(),
+            }
+        # Return a copy so callers can't mutate the cached values
+        return dict(self._metadata_cache)
 
 
 class VersionListDelegate(QStyledItemDelegate):
@@ -1470,6 +1714,7 @@ class VersionPage(QWidget):
         self.list_widget.setItemDelegate(self._delegate)
         self._anim_phase = 0.0
         self._anim_timer = None
+        self._upload_prep_task = None
         self.export_btn = QPushButton("Export Results")
         self.reload_btn = QPushButton("Reload session")
         self.upload_btn = QPushButton("Upload to Panel")
@@ -1531,13 +1776,13 @@ class VersionPage(QWidget):
             # Calculate completion percentage using template-filtered tests
             version_tests, _ = self.controller.get_tests_for_version(vid)
             if version_tests:
-                test_keys = set(t[0] for t in version_tests)
+                test_keys = {t[0] for t in version_tests}
                 total_tests = len(version_tests)
             else:
-                test_keys = set(t[0] for t in TESTS)
+                test_keys = {t[0] for t in TESTS}
                 total_tests = len(TESTS)
             # Use commit-specific results lookup
-            saved_results = get_results_for_version(self.controller.session, vid, current_commit)
+            saved_results = self.controller.get_saved_results(vid, current_commit)
             completed_tests = sum(1 for tk in test_keys if saved_results.get(tk, {}).get('status', ''))
             pct = int((completed_tests / total_tests * 100)) if total_tests > 0 else 0
 
@@ -1601,9 +1846,7 @@ class VersionPage(QWidget):
             self.retests_btn.setToolTip("Check for pending retests")
 
             # Show pending submissions count
-            pending_count = 0
-            if hasattr(self.controller.panel, 'get_pending_submissions_count'):
-                pending_count = self.controller.panel.get_pending_submissions_count()
+            pending_count = self.controller.panel.get_pending_submissions_count()
 
             if pending_count > 0:
                 self.pending_label.setText(f"📤 {pending_count} pending")
@@ -1627,9 +1870,6 @@ class VersionPage(QWidget):
         if not self.controller.panel or not self.controller.panel.is_configured:
             return
 
-        if not hasattr(self.controller.panel, 'retry_pending_submissions'):
-            return
-
         pending_count = self.controller.panel.get_pending_submissions_count()
         if pending_count == 0:
             QMessageBox.information(self, "No Pending", "No pending submissions to retry.")
@@ -1733,20 +1973,9 @@ class VersionPage(QWidget):
             vid_logs = attached_logs.get(original_vid, [])
             version_hashes[storage_key] = compute_version_hash(vid_results, vid_logs)
 
-        # Find versions that have changed locally (for informational purposes)
-        locally_changed = []
-        locally_unchanged = []
-        for vid, current_hash in version_hashes.items():
-            last_hash = upload_hashes.get(vid)
-            if current_hash != last_hash:
-                locally_changed.append(vid)
-            else:
-                locally_unchanged.append(vid)
-
-        # ALWAYS check with the server for ALL versions
-        # This handles the case where a report was deleted on the server
-        # (local hash matches, but server no longer has the report)
-        hashes_to_check = version_hashes.copy()
+        # Find versions that have changed locally (used as fallback if the server check fails)
+        locally_changed = [vid for vid, current_hash in version_hashes.items()
+                           if upload_hashes.get(vid) != current_hash]
 
         # Build test_type from WAN/LAN flags
         test_type = ''
@@ -1759,9 +1988,27 @@ class VersionPage(QWidget):
 
         commit_hash = meta.get('commit', '')
 
+        # Nothing changed locally and the server recently confirmed it holds every report for this
+        # test type and commit (all 'skip', or a completed upload) - skip the round-trip
+        last_check = self.controller.session.get('last_server_check') or {}
+        if (not locally_changed
+                and last_check.get('test_type') == test_type
+                and last_check.get('commit') == commit_hash
+                and time.time() - last_check.get('ts', 0) < SERVER_HASH_CHECK_TTL):
+            QMessageBox.information(self, "Already Up to Date",
+                f"All {len(version_hashes)} report(s) were verified with the server in the last "
+                f"{SERVER_HASH_CHECK_TTL // 60} minutes and have not changed since.\n\n"
+                f"No upload needed.")
+            return
+
+        # ALWAYS check with the server for ALL versions
+        # This handles the case where a report was deleted on the server
+        # (local hash matches, but server no longer has the report).
+        # check_hashes only reads the mapping, so version_hashes is passed as-is.
+
         # Check with server (tester resolved from API key on server side)
         hash_check_result = self.controller.panel.check_hashes(
-            hashes_to_check, test_type, commit_hash
+            version_hashes, test_type, commit_hash
         )
 
         if not hash_check_result.success:
@@ -1781,32 +2028,36 @@ class VersionPage(QWidget):
             # This handles the case where a report was deleted on the server
             changed_versions = []
             skipped_versions = []
+            server_results = hash_check_result.results
 
-            for vid in version_hashes.keys():
-                if vid in hash_check_result.results:
-                    result = hash_check_result.results[vid]
-                    if result.action == 'skip':
-                        # Server has the same hash, truly skip this version
-                        skipped_versions.append(vid)
-                        # Update local hash to match
-                        upload_hashes[vid] = version_hashes[vid]
-                    elif result.action == 'create':
-                        # Report doesn't exist on server (new or was deleted)
-                        changed_versions.append(vid)
-                    else:
-                        # 'update' - report exists but hash differs
-                        changed_versions.append(vid)
+            for vid, result in server_results.items():
+                current_hash = version_hashes.get(vid)
+                if current_hash is None:
+                    # Server echoed a version we didn't ask about
+                    continue
+                if result.action == 'skip':
+                    # Server has the same hash, truly skip this version
+                    skipped_versions.append(vid)
+                    # Update local hash to match
+                    upload_hashes[vid] = current_hash
                 else:
-                    # Version not in response, upload it
+                    # 'create' (new or deleted on server) or 'update' (hash differs)
                     changed_versions.append(vid)
 
+            # Versions not in the response are uploaded as well
+            changed_versions.extend(vid for vid in version_hashes if vid not in server_results)
+
             # Update session with skipped hashes
             if skipped_versions:
                 self.controller.session['upload_hashes'] = upload_hashes
-                self.controller.save_session()
+                self.controller.schedule_save_session()
 
         # Show message if all versions were skipped
         if not changed_versions:
+            # The server confirmed every report - later uploads of the same data can skip the check
+            self.controller.session['last_server_check'] = {
+                'ts': time.time(), 'test_type': test_type, 'commit': commit_hash}
+            self.controller.schedule_save_session()
             QMessageBox.information(self, "Already Up to Date",
                 f"All {len(skipped_versions)} report(s) already exist on the server with identical content.\n\n"
                 f"No upload needed.")
@@ -1824,25 +2075,26 @@ class VersionPage(QWidget):
         timing = self.controller.session.get('timing', {})
         completed = self.controller.session.get('completed', {})
 
-        filtered_results = {}
-        filtered_timing = {}
-        filtered_completed = {}
+        # Bind lookups to locals once and parse each storage key a single time
+        timing_get = timing.get
+        completed_get = completed.get
+        commits_get = version_commits.get
+        meta_commit = meta.get('commit', '')
+        parsed = {k: parse_version_storage_key(k) for k in changed_versions}
+
+        filtered_results = {k: results[k] for k in changed_versions}
+        filtered_timing = {k: timing_get(k, timing_get(vid, 0)) for k, (vid, _) in parsed.items()}
+        filtered_completed = {k: completed_get(k, completed_get(vid, False)) for k, (vid, _) in parsed.items()}
+        # attached_logs uses plain vid - one lookup per key, list shared across commit variants
+        logs_get = attached_logs.get
         filtered_attached_logs = {}
-        filtered_version_commits = {}
-
-        for storage_key in changed_versions:
-            original_vid, commit_from_key = parse_version_storage_key(storage_key)
-            filtered_results[storage_key] = results[storage_key]
-            filtered_timing[storage_key] = timing.get(storage_key, timing.get(original_vid, 0))
-            filtered_completed[storage_key] = completed.get(storage_key, completed.get(original_vid, False))
-            # attached_logs uses plain vid
-            if original_vid in attached_logs:
-                filtered_attached_logs[storage_key] = attached_logs[original_vid]
-            # version_commits - use commit from key if present, else lookup, else meta
-            if commit_from_key:
-                filtered_version_commits[storage_key] = commit_from_key
-            else:
-                filtered_version_commits[storage_key] = version_commits.get(original_vid, meta.get('commit', ''))
+        for k, (vid, _) in parsed.items():
+            vid_logs = logs_get(vid)
+            if vid_logs is not None:
+                filtered_attached_logs[k] = vid_logs
+        # version_commits - use commit from key if present, else lookup, else meta
+        filtered_version_commits = {k: commit_from_key or commits_get(vid, meta_commit)
+                                    for k, (vid, commit_from_key) in parsed.items()}
 
         filtered_session = {
             'meta': meta,
@@ -1853,27 +2105,48 @@ class VersionPage(QWidget):
             'version_commits': filtered_version_commits,
         }
 
-        # Write filtered session to a temp file for upload
-        filtered_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'session_results_upload.json')
-        try:
-            with open(filtered_path, 'w', encoding='utf-8') as f:
-                json.dump(filtered_session, f, indent=2)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to prepare upload: {e}")
-            return
-
-        # Store the changed versions so we can update hashes after successful upload
-        self.controller._pending_upload_versions = changed_versions
-
-        # Show progress dialog
-        self.controller._submission_progress = SubmissionProgressDialog(
-            self, len(changed_versions), changed_versions
-        )
-        self.controller._submission_progress.show()
-
-        # Submit to panel (async)
+        # Store the changed versions with the hashes of the data being uploaded,
+        # so a successful upload can record them without hashing again
+        self.controller._pending_upload_hashes = {k: version_hashes[k] for k in changed_versions}
+        self.controller._pending_upload_check_key = (test_type, commit_hash)
+
+        # Show progress dialog (modal, so the session can't change while it is serialized).
+        # The dialog is created once and reused for later uploads.
+        dlg = self.controller._submission_progress
+        if dlg is None:
+            dlg = SubmissionProgressDialog(self, len(changed_versions), changed_versions)
+            self.controller._submission_progress = dlg
+        else:
+            dlg.reset(len(changed_versions), changed_versions)
+        dlg.show()
+
+        # Serialize to a temp file off the UI thread, then submit to panel (async)
+        task = UploadPrepTask(filtered_session, self.controller._pending_upload_path,
+                              self.controller._pending_upload_digest)
+        task.signals.finished.connect(self._on_upload_prepared)
+        task.signals.error.connect(self._on_upload_prep_failed)
+        self._upload_prep_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_upload_prepared(self, filtered_path, digest):
+        """Submit the prepared upload file once the worker has written it."""
+        self._upload_prep_task = None
+        if filtered_path != self.controller._pending_upload_path:
+            # A different payload was written - drop the stale file from a failed attempt
+            self.controller._remove_pending_upload_file()
+        self.controller._pending_upload_path = filtered_path
+        self.controller._pending_upload_digest = digest
         self.controller.panel.submit_session(filtered_path)
 
+    def _on_upload_prep_failed(self, error):
+        """Close the progress dialog and report a failed upload preparation."""
+        self._upload_prep_task = None
+        self.controller._pending_upload_hashes = {}
+        self.controller._pending_upload_check_key = None
+        if self.controller._submission_progress:
+            self.controller._submission_progress.close()
+        QMessageBox.warning(self, "Error", f"Failed to prepare upload: {error}")
+
     def check_retests(self):
         """Manually check for pending retests."""
         if not self.controller.panel or not self.controller.panel.is_configured:
@@ -1914,6 +2187,55 @@ class VersionPage(QWidget):
         self.controller.export_report()
 
 
+class ReportLogsModel(QtCore.QAbstractListModel):
+    """List model over ReportLog objects; rows are exposed in batches as the view scrolls."""
+
+    BATCH_SIZE = 100
+    LogIdRole = Qt.UserRole
+    FilenameRole = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._logs = []
+        self._loaded = 0
+
+    def set_logs(self, logs):
+        self.beginResetModel()
+        self._logs = list(logs or [])
+        self._loaded = min(len(self._logs), self.BATCH_SIZE)
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < len(self._logs)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(len(self._logs) - self._loaded, self.BATCH_SIZE)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        log = self._logs[index.row()]
+        if role == Qt.DisplayRole:
+            # Format the display text only for rows the view actually paints
+            size_kb = log.size_original / 1024
+            return f"{log.filename} ({size_kb:.1f} KB) - {log.log_datetime}"
+        if role == self.LogIdRole:
+            return log.id
+        if role == self.FilenameRole:
+            return log.filename
+        return None
+
+
 class AttachmentsDialog(QDialog):
     """Dialog for viewing and managing log attachments from the web panel."""
 
@@ -1937,11 +2259,23 @@ class AttachmentsDialog(QDialog):
         self.info_label = QLabel(f"Report #{self.report_id} - Loading attachments...")
         layout.addWidget(self.info_label)
 
-        # List widget for attachments
-        self.list_widget = QListWidget()
-        self.list_widget.setSelectionMode(QListWidget.SingleSelection)
-        self.list_widget.itemDoubleClicked.connect(self.view_selected)
-        layout.addWidget(self.list_widget)
+        # Indeterminate progress bar shown while attachments are fetched
+        self.loading_bar = QProgressBar()
+        self.loading_bar.setRange(0, 0)
+        self.loading_bar.setTextVisible(False)
+        self.loading_bar.setMaximumHeight(8)
+        self.loading_bar.setVisible(False)
+        layout.addWidget(self.loading_bar)
+
+        # List view for attachments (model creates row data on demand)
+        self.logs_model = ReportLogsModel(self)
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setModel(self.logs_model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.list_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.list_view.doubleClicked.connect(self.view_selected)
+        layout.addWidget(self.list_view)
 
         # Buttons
         btn_layout = QHBoxLayout()
@@ -1968,50 +2302,62 @@ class AttachmentsDialog(QDialog):
         self.setLayout(layout)
 
         # Connect selection change
-        self.list_widget.itemSelectionChanged.connect(self.on_selection_changed)
+        self.list_view.selectionModel().selectionChanged.connect(self.on_selection_changed)
 
     def load_attachments(self):
-        """Load attachments from the web panel."""
-        self.list_widget.clear()
+        """Load attachments from the web panel (non-blocking)."""
         self.logs = []
+        self.logs_model.set_logs([])
+        self.info_label.setText(f"Report #{self.report_id} - Loading attachments...")
+        self.loading_bar.setVisible(True)
 
         try:
-            self.logs = self.panel.get_report_logs(self.report_id)
-
-            if not self.logs:
-                self.info_label.setText(f"Report #{self.report_id} - No attachments found")
-                return
+            self.panel.get_report_logs_async(self.report_id, callback=self._on_attachments_loaded)
+        except Exception as e:
+            self.loading_bar.setVisible(False)
+            self.info_label.setText(f"Error loading attachments: {e}")
 
-            self.info_label.setText(f"Report #{self.report_id} - {len(self.logs)} attachment(s)")
+    def _on_attachments_loaded(self, success, logs):
+        """Populate the list once the panel worker returns the report logs."""
+        try:
+            self.loading_bar.setVisible(False)
+        except RuntimeError:
+            # Dialog was closed before the request finished
+            return
 
-            for log in self.logs:
-                # Format the display text
-                size_kb = log.size_original / 1024
-                display_text = f"{log.filename} ({size_kb:.1f} KB) - {log.log_datetime}"
+        if not success:
+            self.info_label.setText(f"Error loading attachments: {logs}")
+            return
 
-                item = QListWidgetItem(display_text)
-                item.setData(QtCore.Qt.UserRole, log.id)  # Store log ID
-                item.setData(QtCore.Qt.UserRole + 1, log.filename)  # Store filename
-                self.list_widget.addItem(item)
+        self.logs = logs or []
+        if not self.logs:
+            self.info_label.setText(f"Report #{self.report_id} - No attachments found")
+            return
 
-        except Exception as e:
-            self.info_label.setText(f"Error loading attachments: {e}")
+        self.info_label.setText(f"Report #{self.report_id} - {len(self.logs)} attachment(s)")
+        self.logs_model.set_logs(self.logs)
 
     def on_selection_changed(self):
         """Handle selection change."""
-        has_selection = bool(self.list_widget.selectedItems())
+        has_selection = self.list_view.selectionModel().hasSelection()
         self.view_btn.setEnabled(has_selection)
         self.delete_btn.setEnabled(has_selection)
 
+    def _selected_log(self):
+        """Return (log_id, filename) for the selected row, or None."""
+        indexes = self.list_view.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        index = indexes[0]
+        return index.data(ReportLogsModel.LogIdRole), index.data(ReportLogsModel.FilenameRole)
+
     def view_selected(self):
         """Download and view selected attachment in notepad."""
-        items = self.list_widget.selectedItems()
-        if not items:
+        selected = self._selected_log()
+        if not selected:
             return
 
-        item = items[0]
-        log_id = item.data(QtCore.Qt.UserRole)
-        filename = item.data(QtCore.Qt.UserRole + 1)
+        log_id, filename = selected
 
         try:
             # Download the log content
@@ -2022,7 +2368,6 @@ class AttachmentsDialog(QDialog):
                 return
 
             # Create a temp file and open in notepad
-            import tempfile
             temp_dir = tempfile.gettempdir()
             temp_path = os.path.join(temp_dir, f"steam_test_{filename}")
 
@@ -2042,13 +2387,11 @@ class AttachmentsDialog(QDialog):
 
     def delete_selected(self):
         """Delete the selected attachment."""
-        items = self.list_widget.selectedItems()
-        if not items:
+        selected = self._selected_log()
+        if not selected:
             return
 
-        item = items[0]
-        log_id = item.data(QtCore.Qt.UserRole)
-        filename = item.data(QtCore.Qt.UserRole + 1)
+        log_id, filename = selected
 
         # Confirm deletion
         reply = QMessageBox.question(self, "Confirm Delete",
@@ -2074,64 +2417,176 @@ class AttachmentsDialog(QDialog):
             QMessageBox.warning(self, "Error", f"Failed to delete attachment: {e}")
 
 
+class UploadPrepSignals(QtCore.QObject):
+    """Signals emitted by UploadPrepTask back to the GUI thread."""
+    finished = QtCore.pyqtSignal(str, str)  # (path, payload digest)
+    error = QtCore.pyqtSignal(str)
+
+
+class UploadPrepTask(QtCore.QRunnable):
+    """Serialize a filtered session to a temp file on a pool thread.
+
+    If the payload is byte-identical to the previous upload file (e.g. a retry
+    after a failed submission) and that file still exists, it is reused as-is.
+    """
+
+    def __init__(self, filtered_session, previous_path=None, previous_digest=None):
+        super().__init__()
+        self.filtered_session = filtered_session
+        self.previous_path = previous_path
+        self.previous_digest = previous_digest
+        self.signals = UploadPrepSignals()
+
+    def run(self):
+        path = None
+        try:
+            data = dump_json_bytes(self.filtered_session)
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if (digest == self.previous_digest and self.previous_path
+                    and os.path.isfile(self.previous_path)):
+                self.signals.finished.emit(self.previous_path, digest)
+                return
+            # Reserve a unique name, then fill it atomically
+            with tempfile.NamedTemporaryFile(prefix='upload_', suffix='.json', delete=False) as tf:
+                path = tf.name
+            atomic_write_bytes(path, data)
+        except Exception as e:
+            if path is not None:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(path, digest)
+
+
+class SessionWriteTask(QtCore.QRunnable):
+    """Write already-serialized session bytes to disk on a pool thread.
+
+    Tasks run on a single-thread pool in submission order; a task that has been
+    superseded by a newer write before it starts is skipped.
+    """
+
+    def __init__(self, controller, seq, path, data):
+        super().__init__()
+        self.controller = controller
+        self.seq = seq
+        self.path = path
+        self.data = data
+
+    def run(self):
+        if self.seq != self.controller._session_write_seq:
+            return
+        try:
+            atomic_write_bytes(self.path, self.data, fsync=True)
+        except Exception:
+            # the queued bytes never reached disk, so an identical save must not be dropped
+            if self.seq == self.controller._session_write_seq:
+                self.controller._session_queued_digest = None
+
+
+class LogCompressSignals(QtCore.QObject):
+    """Signals emitted by LogCompressTask back to the GUI thread."""
+    finished = QtCore.pyqtSignal(object)  # find_and_compress_log_files() result dict
+
+
+class LogCompressTask(QtCore.QRunnable):
+    """Run find_and_compress_log_files() on a pool thread."""
+
+    def __init__(self, emulator_path, packages, max_hours=13):
+        super().__init__()
+        self.emulator_path = emulator_path
+        self.packages = packages
+        self.max_hours = max_hours
+        self.signals = LogCompressSignals()
+
+    def run(self):
+        try:
+            result = find_and_compress_log_files(self.emulator_path, self.packages, max_hours=self.max_hours)
+        except Exception as e:
+            result = {'success': False, 'logs': [], 'error': str(e)}
+        self.signals.finished.emit(result)
+
+
+def _progress_bar_qss(color, border='#ccc'):
+    return (
+        f"QProgressBar {{ border: 1px solid {border}; border-radius: 5px; "
+        f"background-color: #f0f0f0; height: 20px; }} "
+        f"QProgressBar::chunk {{ background-color: {color}; border-radius: 4px; }}"
+    )
+
+
 class SubmissionProgressDialog(QDialog):
     """Dialog showing submission progress with an indeterminate progress bar."""
 
+    # Stylesheets are built once per class rather than on every state change
+    BAR_QSS_ACTIVE = _progress_bar_qss('#3498db')
+    BAR_QSS_SUCCESS = _progress_bar_qss('#27ae60', '#27ae60')
+    BAR_QSS_FAILURE = _progress_bar_qss('#e74c3c', '#e74c3c')
+    STATUS_QSS = "font-size: 14px; font-weight: bold;"
+    STATUS_QSS_SUCCESS = STATUS_QSS + " color: #27ae60;"
+    STATUS_QSS_FAILURE = STATUS_QSS + " color: #e74c3c;"
+
     def __init__(self, parent=None, version_count=0, versions=None):
         super().__init__(parent)
         self.setWindowTitle("Uploading Report")
         self.setMinimumWidth(400)
         self.setModal(True)
-        # Remove close button to prevent closing during upload
-        self.setWindowFlags(self.windowFlags() & ~Qt.WindowCloseButtonHint)
-        self.setup_ui(version_count, versions or [])
+        # Auto-close timer after a successful upload (stopped if the dialog is reused)
+        self._close_timer = QTimer(self)
+        self._close_timer.setSingleShot(True)
+        self._close_timer.timeout.connect(self.accept)
+        self.setup_ui()
+        self.reset(version_count, versions or [])
 
-    def setup_ui(self, version_count, versions):
+    def setup_ui(self):
         layout = QVBoxLayout()
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
 
         # Status label
-        self.status_label = QLabel(f"Uploading {version_count} report(s) to panel...")
-        self.status_label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.status_label = QLabel()
         layout.addWidget(self.status_label)
 
         # Version list (show first few)
-        if versions:
-            version_text = ", ".join(versions[:5])
-            if len(versions) > 5:
-                version_text += f"\n...and {len(versions) - 5} more"
-            version_label = QLabel(version_text)
-            version_label.setStyleSheet("color: #666; font-size: 12px;")
-            version_label.setWordWrap(True)
-            layout.addWidget(version_label)
+        self.version_label = QLabel()
+        self.version_label.setStyleSheet("color: #666; font-size: 12px;")
+        self.version_label.setWordWrap(True)
+        layout.addWidget(self.version_label)
 
         # Progress bar (indeterminate)
         self.progress_bar = QProgressBar()
-        self.progress_bar.setMinimum(0)
-        self.progress_bar.setMaximum(0)  # Indeterminate mode
         self.progress_bar.setTextVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                background-color: #f0f0f0;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #3498db;
-                border-radius: 4px;
-            }
-        """)
         layout.addWidget(self.progress_bar)
 
         # Info label
-        self.info_label = QLabel("Please wait...")
+        self.info_label = QLabel()
         self.info_label.setStyleSheet("color: #888; font-size: 11px;")
         layout.addWidget(self.info_label)
 
         self.setLayout(layout)
 
+    def reset(self, version_count, versions):
+        """Return the dialog to its in-progress state so it can be reused for another upload."""
+        self._close_timer.stop()
+        # Remove close button to prevent closing during upload
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowCloseButtonHint)
+
+        self.status_label.setText(f"Uploading {version_count} report(s) to panel...")
+        self.status_label.setStyleSheet(self.STATUS_QSS)
+
+        if versions:
+            version_text = ", ".join(versions[:5])
+            if len(versions) > 5:
+                version_text += f"\n...and {len(versions) - 5} more"
+            self.version_label.setText(version_text)
+        self.version_label.setVisible(bool(versions))
+
+        self.progress_bar.setRange(0, 0)  # Indeterminate mode
+        self.progress_bar.setStyleSheet(self.BAR_QSS_ACTIVE)
+        self.info_label.setText("Please wait...")
+
     def set_complete(self, success, message):
         """Update dialog to show completion status."""
         self.progress_bar.setMaximum(100)
@@ -2139,36 +2594,13 @@ class SubmissionProgressDialog(QDialog):
 
         if success:
             self.status_label.setText("Upload Complete!")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #27ae60;")
-            self.info_label.setText(message)
-            self.progress_bar.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #27ae60;
-                    border-radius: 5px;
-                    background-color: #f0f0f0;
-                    height: 20px;
-                }
-                QProgressBar::chunk {
-                    background-color: #27ae60;
-                    border-radius: 4px;
-                }
-            """)
+            self.status_label.setStyleSheet(self.STATUS_QSS_SUCCESS)
+            self.progress_bar.setStyleSheet(self.BAR_QSS_SUCCESS)
         else:
             self.status_label.setText("Upload Failed")
-            self.status_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #e74c3c;")
-            self.info_label.setText(message)
-            self.progress_bar.setStyleSheet("""
-                QProgressBar {
-                    border: 1px solid #e74c3c;
-                    border-radius: 5px;
-                    background-color: #f0f0f0;
-                    height: 20px;
-                }
-                QProgressBar::chunk {
-                    background-color: #e74c3c;
-                    border-radius: 4px;
-                }
-            """)
+            self.status_label.setStyleSheet(self.STATUS_QSS_FAILURE)
+            self.progress_bar.setStyleSheet(self.BAR_QSS_FAILURE)
+        self.info_label.setText(message)
 
         # Re-enable close button and allow closing
         self.setWindowFlags(self.windowFlags() | Qt.WindowCloseButtonHint)
@@ -2176,7 +2608,7 @@ class SubmissionProgressDialog(QDialog):
 
         # Auto-close after delay for success
         if success:
-            QtCore.QTimer.singleShot(2000, self.accept)
+            self._close_timer.start(2000)
 
 
 class FlagNotificationDialog(QDialog):
@@ -2207,7 +2639,7 @@ class FlagNotificationDialog(QDialog):
             item_color = "#e8f5e9"  # Light green
             border_color = "#4caf50"
 
-        html = f"""
+        parts = [f"""
         <style>
             .flag-item {{ margin-bottom: 15px; padding: 10px; background: {item_color};
                           border-left: 3px solid {border_color}; border-radius: 5px; }}
@@ -2216,39 +2648,34 @@ class FlagNotificationDialog(QDialog):
             .notes {{ background: #fff; padding: 8px; margin-top: 8px; font-size: 12px; border-radius: 3px; }}
         </style>
         {header}
-        """
+        """]
+        append = parts.append
+        icon = "🔄" if self.flag_type == 'retest' else "✅"
 
         for flag in self.flags:
-            test_key = flag.get('test_key', 'Unknown')
-            test_name = flag.get('test_name', '')
-            version = flag.get('client_version', 'Unknown')
-            reason = flag.get('reason', '')
-            notes = flag.get('notes', '')
-            report_id = flag.get('report_id')
-
-            icon = "🔄" if self.flag_type == 'retest' else "✅"
-            html += f'<div class="flag-item">'
-            html += f'<div class="flag-header">{icon} Test {test_key}'
+            get = flag.get
+            test_name = get('test_name', '')
+            reason = get('reason', '')
+            notes = get('notes', '')
+            report_id = get('report_id')
+
+            append(f'<div class="flag-item"><div class="flag-header">{icon} Test {get("test_key", "Unknown")}')
             if test_name:
-                html += f': {test_name}'
-            html += '</div>'
-            html += f'<div class="flag-meta">'
-            html += f'Version: {version}'
+                append(f': {test_name}')
+            append(f'</div><div class="flag-meta">Version: {get("client_version", "Unknown")}')
             if reason:
-                html += f'<br>Reason: {reason}'
+                append(f'<br>Reason: {reason}')
             if report_id:
-                html += f'<br>Report ID: #{report_id}'
-            html += '</div>'
+                append(f'<br>Report ID: #{report_id}')
+            append('</div>')
 
             if notes:
-                html += '<div class="notes">'
-                notes_escaped = notes.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                notes_html = notes_escaped.replace('\n', '<br>')
-                html += f'📝 <b>Notes:</b> {notes_html}'
-                html += '</div>'
+                notes_html = html_lib.escape(notes, quote=False).replace('\n', '<br>')
+                append(f'<div class="notes">📝 <b>Notes:</b> {notes_html}</div>')
 
-            html += '</div>'
+            append('</div>')
 
+        html = ''.join(parts)
         text.setHtml(html)
         layout.addWidget(text)
 
@@ -2325,12 +2752,8 @@ class VersionNotificationsDialog(QDialog):
             notif_layout.addWidget(name_label)
 
             # Message content - support basic HTML
-            message = n.get('message', '')
             # Convert BBCode-style formatting if present
-            message = message.replace('[b]', '<b>').replace('[/b]', '</b>')
-            message = message.replace('[i]', '<i>').replace('[/i]', '</i>')
-            message = message.replace('[u]', '<u>').replace('[/u]', '</u>')
-            message = message.replace('\n', '<br>')
+            message = bbcode_to_html(n.get('message', ''))
 
             msg_label = QLabel(message)
             msg_label.setWordWrap(True)
@@ -2372,23 +2795,505 @@ class VersionNotificationsDialog(QDialog):
         self.adjustSize()
 
 
+# Image markers and tags stripped from notes when building the plain-text row preview
+NOTES_PREVIEW_IMAGE_PATTERN = re.compile(
+    r'\{\{IMAGE:[^}]*\}\}|\[image:data:[^\]]*\]|!\[[^\]]*\]\(data:[^)]*\)|<img\b[^>]*>', re.I)
+NOTES_PREVIEW_BREAK_PATTERN = re.compile(r'<br\s*/?>|</p>|</div>|</li>', re.I)
+NOTES_PREVIEW_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def notes_preview_text(notes: str) -> str:
+    """Reduce stored notes to plain text for painting a read-only row preview."""
+    if not notes:
+        return ''
+    text = NOTES_PREVIEW_IMAGE_PATTERN.sub('[image]', notes)
+    text = NOTES_PREVIEW_BREAK_PATTERN.sub('\n', text)
+    text = html_lib.unescape(NOTES_PREVIEW_TAG_PATTERN.sub('', text))
+    return '\n'.join(line.rstrip() for line in text.splitlines() if line.strip())
+
+
+class TestsModel(QtCore.QAbstractListModel):
+    """List model for the TestPage: one row per test with its status and notes.
+
+    Notes are held in the stored (cleaned) format; rows are only turned into
+    editor widgets when the user activates them. Rows are exposed to the view
+    in batches (see fetchMore) so a long test list shows its first rows at once.
+    """
+
+    BATCH_SIZE = 10
+    ROLE_TEST = Qt.UserRole + 1       # (tnum, tname, tdesc)
+    ROLE_STATUS = Qt.UserRole + 2     # status text ('' if unset)
+    ROLE_NOTES = Qt.UserRole + 3      # stored notes
+    ROLE_EDITOR_HTML = Qt.UserRole + 4  # notes prepared for ImageTextEdit.setHtml()
+    ROLE_PREVIEW = Qt.UserRole + 5    # plain-text notes preview
+    ROLE_RETEST = Qt.UserRole + 6     # True if the test needs retesting
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tests = []
+        self._status = []
+        self._notes = []
+        self._editor_html = []
+        self._previews = []
+        self._retest_keys = set()
+        self._loaded = 0
+
+    def load(self, tests, saved, retest_keys):
+        """Reset the model to the given tests, seeding status/notes from saved results."""
+        # Build every row off to the side, then swap it in with a single reset so
+        # attached views relayout once rather than per inserted row
+        tests = list(tests)
+        status = []
+        notes_list = []
+        for tnum, _, _ in tests:
+            r = saved.get(tnum) or {}
+            status.append(r.get('status', '') or '')
+            notes_list.append(r.get('notes', '') or '')
+
+        self.beginResetModel()
+        self._tests = tests
+        self._status = status
+        self._notes = notes_list
+        self._editor_html = [None] * len(tests)
+        self._previews = [None] * len(tests)
+        self._retest_keys = set(retest_keys)
+        self._loaded = min(len(tests), self.BATCH_SIZE)
+        self._prepare_rows(0, self._loaded)
+        self.endResetModel()
+
+    def _prepare_rows(self, start, end):
+        # Convert saved notes to editor HTML once per batch; the QTextDocument parse
+        # (setHtml) only happens when a row's editor is opened
+        for row in range(start, end):
+            notes = self._notes[row]
+            self._editor_html[row] = prepare_notes_for_editor(convert_old_thumbnail_format(notes)) if notes else ''
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def total_count(self):
+        """Number of tests held by the model, including rows not yet exposed to the view."""
+        return len(self._tests)
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < len(self._tests)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(len(self._tests) - self._loaded, self.BATCH_SIZE)
+        if count <= 0:
+            return
+        self._prepare_rows(self._loaded, self._loaded + count)
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        row = index.row()
+        if role == self.ROLE_TEST:
+            return self._tests[row]
+        if role == Qt.DisplayRole:
+            tnum, tname, _ = self._tests[row]
+            return f"{tnum} — {tname}"
+        if role == self.ROLE_STATUS:
+            return self._status[row]
+        if role == self.ROLE_NOTES:
+            return self._notes[row]
+        if role == self.ROLE_EDITOR_HTML:
+            if self._editor_html[row] is None:
+                self._editor_html[row] = prepare_notes_for_editor(self._notes[row])
+            return self._editor_html[row]
+        if role == self.ROLE_PREVIEW:
+            if self._previews[row] is None:
+                self._previews[row] = notes_preview_text(self._notes[row])
+            return self._previews[row]
+        if role == self.ROLE_RETEST:
+            return self._tests[row][0] in self._retest_keys
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = index.row()
+        if role == self.ROLE_STATUS:
+            if self._status[row] == value:
+                return False
+            self._status[row] = value
+        elif role == self.ROLE_NOTES:
+            if self._notes[row] == value:
+                return False
+            self._notes[row] = value
+            self._editor_html[row] = None
+            self._previews[row] = None
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def test_key(self, row):
+        return self._tests[row][0]
+
+    def status(self, row):
+        return self._status[row]
+
+    def notes(self, row):
+        return self._notes[row]
+
+
+# Fill colors for the selected segment of a status selector, keyed by STATUS_OPTIONS text
+STATUS_SEGMENT_COLORS = {
+    "Working": QColor('#27ae60'),
+    "Semi-working": QColor('#f39c12'),
+    "Not working": QColor('#e74c3c'),
+    "N/A": QColor('#7f8c8d'),
+}
+STATUS_SEGMENT_BG = QColor('#f4f6f7')
+STATUS_SEGMENT_BORDER = QColor('#c8c8c8')
+
+
+def paint_status_segments(painter, rect, value, font):
+    """Paint the stacked status segments (STATUS_OPTS_UI) into rect, highlighting index value."""
+    opts = STATUS_OPTS_UI
+    slot_h = rect.height() // len(opts)
+    painter.save()
+    painter.setRenderHint(painter.Antialiasing, True)
+    painter.setFont(font)
+    for i, opt in enumerate(opts):
+        seg = QRect(rect.left(), rect.top() + i * slot_h, rect.width(), slot_h).adjusted(0, 2, -1, -2)
+        if i == value:
+            color = STATUS_SEGMENT_COLORS[opt]
+            painter.setPen(QPen(color, 1))
+            painter.setBrush(color)
+            text_color = QColor('#ffffff')
+        else:
+            painter.setPen(QPen(STATUS_SEGMENT_BORDER, 1))
+            painter.setBrush(STATUS_SEGMENT_BG)
+            text_color = QColor('#333333')
+        painter.drawRoundedRect(seg, 4, 4)
+        painter.setPen(text_color)
+        painter.drawText(seg, Qt.AlignCenter, opt)
+    painter.restore()
+
+
+class StatusSelector(QWidget):
+    """Single painted widget for picking one of STATUS_OPTS_UI (replaces a radio button group)."""
+
+    valueChanged = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._value = -1  # -1 means no status selected
+        self.setCursor(Qt.PointingHandCursor)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+
+    def value(self):
+        return self._value
+
+    def setValue(self, value):
+        if value != self._value:
+            self._value = value
+            self.update()
+            self.valueChanged.emit(value)
+
+    def sizeHint(self):
+        return QSize(110, 26 * len(STATUS_OPTS_UI))
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            slot_h = max(1, self.height() // len(STATUS_OPTS_UI))
+            index = event.pos().y() // slot_h
+            if 0 <= index < len(STATUS_OPTS_UI):
+                self.setValue(index)
+        super().mousePressEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        paint_status_segments(painter, self.rect(), self._value, self.font())
+
+
+class TestRowEditor(QFrame):
+    """Editing widgets for the active TestPage row (title, status radios, notes editor)."""
+
+    STYLE_ACTIVE = "#testRowEditor { background-color: #e3f2fd; border: 2px solid #2196f3; border-radius: 4px; }"
+    _STYLE_TITLE_RETEST = "color: #e74c3c; font-weight: bold;"
+    _STYLE_TITLE_NORMAL = ""
+    _STYLE_DESC_RETEST = "color: #e74c3c; font-style: italic; font-size: 11px;"
+    _STYLE_DESC_NORMAL = "color: #888; font-style: italic; font-size: 11px;"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._is_retest = None  # retest styling currently applied; None until the first set_test()
+        self.setObjectName('testRowEditor')
+        self.setAutoFillBackground(True)
+        self.setStyleSheet(self.STYLE_ACTIVE)
+        fl = QHBoxLayout()
+
+        # Create a container for the test title and description
+        title_container = QWidget()
+        title_layout = QVBoxLayout()
+        title_layout.setContentsMargins(0, 0, 0, 0)
+        title_layout.setSpacing(2)
+        self.title_label = QLabel()
+        self.title_label.setWordWrap(True)
+        self.desc_label = QLabel()
+        self.desc_label.setWordWrap(True)
+        title_layout.addStretch()
+        title_layout.addWidget(self.title_label)
+        title_layout.addWidget(self.desc_label)
+        title_layout.addStretch()
+        title_container.setLayout(title_layout)
+
+        # status selector over STATUS_OPTS_UI; no selection initially
+        self.status_selector = StatusSelector()
+
+        self.notes = ImageTextEdit()
+        self.notes.setMaximumHeight(120)
+
+        fl.addWidget(title_container, 2)
+        fl.addWidget(self.status_selector, 1)
+        fl.addWidget(self.notes, 3)
+        self.setLayout(fl)
+
+    def set_test(self, tnum, tname, tdesc, is_retest):
+        self.title_label.setText(f"{tnum} — {tname}")
+        self.desc_label.setText(tdesc or "")
+        self.desc_label.setVisible(bool(tdesc))
+        # Moving between rows of the same kind keeps the labels' style sheets as they are;
+        # only a retest/normal switch pays for a style recomputation
+        is_retest = bool(is_retest)
+        if is_retest == self._is_retest:
+            return
+        self._is_retest = is_retest
+        if is_retest:
+            self.title_label.setStyleSheet(self._STYLE_TITLE_RETEST)
+            self.desc_label.setStyleSheet(self._STYLE_DESC_RETEST)
+            self.title_label.setToolTip("⚠️ This test needs retesting!")
+        else:
+            self.title_label.setStyleSheet(self._STYLE_TITLE_NORMAL)
+            self.desc_label.setStyleSheet(self._STYLE_DESC_NORMAL)
+            self.title_label.setToolTip("")
+
+    def status(self):
+        value = self.status_selector.value()
+        return STATUS_OPTS_UI[value] if value >= 0 else ''
+
+    def set_status(self, status):
+        # skip the empty string option; unknown or empty status clears the selection
+        self.status_selector.setValue(STATUS_SEGMENT_INDEX.get(status, -1))
+
+
+class TestListDelegate(QStyledItemDelegate):
+    """Paints TestPage rows directly; only the active row gets a TestRowEditor."""
+
+    ROW_HEIGHT = 142
+    MARGIN = 9
+    SPACING = 6
+    NOTES_MAX_HEIGHT = 120
+
+    _RETEST_BG = QColor('#fff5f5')
+    _RETEST_BORDER = QColor('#e74c3c')
+    _FOCUS_BG = QColor('#e3f2fd')
+    _FOCUS_BORDER = QColor('#2196f3')
+    _DESC_COLOR = QColor('#888888')
+    _NOTES_BG = QColor('#ffffff')
+    _NOTES_BORDER = QColor('#c8c8c8')
+    _NOTES_TEXT = QColor('#333333')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.current_row = -1   # keyboard-focused row
+        self.editor_row = -1    # row currently covered by a TestRowEditor
+        self._editor = None     # single pooled TestRowEditor, moved between rows
+        # Fonts/metrics derived from the view font, built once per base font
+        self._fonts_key = None
+        self._fonts = None
+        # (title text, desc, width, is_retest) -> (title_h, desc_h) for the title column
+        self._title_layout = {}
+
+    def _fonts_for(self, base_font):
+        """Return (title, retest title, desc) fonts and their metrics for base_font."""
+        key = base_font.key()
+        if key != self._fonts_key:
+            title_font = QFont(base_font)
+            retest_font = QFont(base_font)
+            retest_font.setBold(True)
+            desc_font = QFont(base_font)
+            desc_font.setItalic(True)
+            desc_font.setPixelSize(11)
+            self._fonts = (
+                (title_font, QFontMetrics(title_font)),
+                (retest_font, QFontMetrics(retest_font)),
+                (desc_font, QFontMetrics(desc_font)),
+            )
+            self._fonts_key = key
+            self._title_layout.clear()
+        return self._fonts
+
+    def _column_rects(self, rect):
+        """Split a row into title / status / notes columns (2:1:3, like the old frame layout)."""
+        content = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        avail = content.width() - 2 * self.SPACING
+        title_w = avail * 2 // 6
+        status_w = avail // 6
+        notes_w = avail - title_w - status_w
+        x = content.left()
+        title_rect = QRect(x, content.top(), title_w, content.height())
+        x += title_w + self.SPACING
+        status_rect = QRect(x, content.top(), status_w, content.height())
+        x += status_w + self.SPACING
+        notes_rect = QRect(x, content.top(), notes_w, content.height())
+        return title_rect, status_rect, notes_rect
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing, True)
+        row = index.row()
+        is_retest = bool(index.data(TestsModel.ROLE_RETEST))
+        frame_rect = option.rect.adjusted(1, 1, -2, -2)
+
+        # --- Background ---
+        if row == self.current_row or row == self.editor_row:
+            painter.setPen(QPen(self._FOCUS_BORDER, 2))
+            painter.setBrush(self._FOCUS_BG)
+            painter.drawRoundedRect(frame_rect, 4, 4)
+        elif is_retest:
+            painter.setPen(QPen(self._RETEST_BORDER, 1))
+            painter.setBrush(self._RETEST_BG)
+            painter.drawRoundedRect(frame_rect, 4, 4)
+
+        # The editor widget draws its own contents on top of this row
+        if row == self.editor_row:
+            painter.restore()
+            return
+
+        tnum, tname, tdesc = index.data(TestsModel.ROLE_TEST)
+        title_rect, status_rect, notes_rect = self._column_rects(option.rect)
+
+        # --- Title + description, vertically centered ---
+        plain, retest, (desc_font, desc_metrics) = self._fonts_for(option.font)
+        title_font, title_metrics = retest if is_retest else plain
+        flags = Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap
+        title_text = f"{tnum} — {tname}"
+        # Word-wrapped text measurement is the costly part of a row paint; rows are
+        # repainted constantly while scrolling but only change size with the view width
+        layout_key = (title_text, tdesc, title_rect.width(), is_retest)
+        heights = self._title_layout.get(layout_key)
+        if heights is None:
+            if len(self._title_layout) > 4096:
+                # Window resizes leave entries for stale widths behind
+                self._title_layout.clear()
+            title_h = title_metrics.boundingRect(title_rect, flags, title_text).height()
+            desc_h = desc_metrics.boundingRect(title_rect, flags, tdesc).height() + 2 if tdesc else 0
+            heights = self._title_layout[layout_key] = (title_h, desc_h)
+        title_h, desc_h = heights
+        top = title_rect.top() + max(0, (title_rect.height() - title_h - desc_h) // 2)
+        painter.setFont(title_font)
+        painter.setPen(self._RETEST_BORDER if is_retest else option.palette.color(QPalette.Text))
+        painter.drawText(QRect(title_rect.left(), top, title_rect.width(), title_h), flags, title_text)
+        if tdesc:
+            painter.setFont(desc_font)
+            painter.setPen(self._RETEST_BORDER if is_retest else self._DESC_COLOR)
+            painter.drawText(QRect(title_rect.left(), top + title_h + 2, title_rect.width(),
+                                   title_rect.bottom() - top - title_h), flags, tdesc)
+
+        # --- Status segments (same painting as the editor's StatusSelector) ---
+        status = index.data(TestsModel.ROLE_STATUS)
+        value = STATUS_SEGMENT_INDEX.get(status, -1)
+        paint_status_segments(painter, status_rect, value, option.font)
+
+        # --- Notes preview ---
+        box_h = min(self.NOTES_MAX_HEIGHT, notes_rect.height())
+        box = QRect(notes_rect.left(), notes_rect.top() + (notes_rect.height() - box_h) // 2,
+                    notes_rect.width(), box_h)
+        painter.setPen(self._NOTES_BORDER)
+        painter.setBrush(self._NOTES_BG)
+        painter.drawRect(box)
+        preview = index.data(TestsModel.ROLE_PREVIEW)
+        if preview:
+            painter.setFont(option.font)
+            painter.setPen(self._NOTES_TEXT)
+            painter.drawText(box.adjusted(4, 4, -4, -4), Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, preview)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def createEditor(self, parent, option, index):
+        # The editor (and its ImageTextEdit) is built the first time a row is focused,
+        # then reused for every later row instead of being rebuilt per activation
+        if self._editor is None:
+            self._editor = TestRowEditor(parent)
+        elif self._editor.parent() is not parent:
+            self._editor.setParent(parent)
+        return self._editor
+
+    def destroyEditor(self, editor, index):
+        if editor is self._editor:
+            # Keep the pooled editor alive; the view has already hidden it
+            return
+        super().destroyEditor(editor, index)
+
+    def setEditorData(self, editor, index):
+        tnum, tname, tdesc = index.data(TestsModel.ROLE_TEST)
+        editor.set_test(tnum, tname, tdesc, bool(index.data(TestsModel.ROLE_RETEST)))
+        editor.set_status(index.data(TestsModel.ROLE_STATUS))
+        editor.notes.setHtml(index.data(TestsModel.ROLE_EDITOR_HTML) or '')
+        editor.notes.document().setModified(False)
+
+    def setModelData(self, editor, model, index):
+        # Read everything before writing: setData() refreshes the open editor via dataChanged
+        status = editor.status()
+        notes = None
+        # Only re-clean notes the user actually edited, so untouched notes keep their stored form
+        document = editor.notes.document()
+        if document.isModified():
+            if document.isEmpty():
+                # Cleared by the user - nothing to serialize
+                notes = ''
+            else:
+                # Clean notes immediately when saving - this converts code block markers
+                # to proper <pre><code> format and preserves embedded images
+                notes = clean_notes(editor.notes.toHtml())
+        model.setData(index, status, TestsModel.ROLE_STATUS)
+        if notes is not None:
+            model.setData(index, notes, TestsModel.ROLE_NOTES)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect.adjusted(1, 1, -2, -2))
+
+
 class TestPage(QWidget):
     def __init__(self, parent=None, controller=None):
         super().__init__(parent)
         self.controller = controller
         self.current_test_index = 0  # Track focused test for keyboard navigation
-        self.test_frames = []  # Store references to test frames for highlighting
+        self._populate_pending = False  # a _populate_next_chunk() call is queued
+        self._report_lookup_seq = 0  # bumped per _update_button_visibility() to drop stale replies
+        self._log_compress_task = None  # running LogCompressTask (kept so its signals outlive start())
         layout = QVBoxLayout()
         self.header = QLabel("")
+        # "Version: ... — Packages: ..." for the loaded version; the controller's
+        # tick appends the timing line to it
+        self.header_base = ""
         layout.addWidget(self.header)
 
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        content = QWidget()
-        self.form = QVBoxLayout()
-        content.setLayout(self.form)
-        self.scroll.setWidget(content)
-        layout.addWidget(self.scroll)
+        # Tests are painted by TestListDelegate; only the active row has real editor widgets
+        self.test_model = TestsModel(self)
+        self.test_delegate = TestListDelegate(self)
+        self.test_view = QtWidgets.QListView()
+        self.test_view.setModel(self.test_model)
+        self.test_view.setItemDelegate(self.test_delegate)
+        self.test_view.setUniformItemSizes(True)
+        self.test_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.test_view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.test_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.test_view.clicked.connect(self._on_test_clicked)
+        self._editor_index = None  # QPersistentModelIndex of the row with an open editor
+        layout.addWidget(self.test_view)
 
         hl = QHBoxLayout()
         self.stopwatch_label = QLabel("Stopwatch: 0:00:00")
@@ -2429,23 +3334,28 @@ class TestPage(QWidget):
         hl.addWidget(self.finish_btn)
         layout.addLayout(hl)
         self.setLayout(layout)
-        self.entries = []
         self.stopwatch_running = False
         self.stopwatch_elapsed = 0.0
         self._stopwatch_start = None
+        self._last_stopwatch_seconds = None  # whole seconds currently shown on the label
         self._stopwatch_timer = QtCore.QTimer(self)
-        self._stopwatch_timer.timeout.connect(self._update_stopwatch_display)
-        self._stopwatch_timer.setInterval(200)
+        self._stopwatch_timer.timeout.connect(self._on_stopwatch_tick)
+        # The label only shows whole seconds, so tick once a second and let the OS
+        # coalesce the wakeup with others
+        self._stopwatch_timer.setInterval(1000)
+        self._stopwatch_timer.setTimerType(Qt.VeryCoarseTimer)
         self._update_stopwatch_display()
         # Cache for current version's report ID
         self._current_report_id = None
 
     def load_tests(self, version):
-        self.header.setText(f"Version: {version['id']} — Packages: {', '.join(version.get('packages', []))}")
+        self.header_base = f"Version: {version['id']} — Packages: {', '.join(version.get('packages', []))}"
+        self.header.setText(self.header_base)
         self.reset_stopwatch()
+        meta = self.controller.intro.get_metadata()
 
         # Update button visibility based on emulator path and panel state
-        self._update_button_visibility(version)
+        self._update_button_visibility(version, meta)
 
         # Get retests for this specific version from panel
         retest_test_keys = set()
@@ -2458,12 +3368,7 @@ class TestPage(QWidget):
                 pass
 
         # clear
-        for i in reversed(range(self.form.count())):
-            w = self.form.itemAt(i).widget()
-            if w:
-                w.setParent(None)
-        self.entries = []
-        self.test_frames = []  # Reset frame references
+        self._close_editor(commit=False)
         self.current_test_index = 0  # Reset current test index
 
         # Try to get version-specific tests from API (uses version-specific template if assigned)
@@ -2476,112 +3381,103 @@ class TestPage(QWidget):
             # Fall back to global TESTS if API not available
             tests_to_show = TESTS
 
-        for tnum, tname, tdesc in tests_to_show:
-            # Tests are already filtered by template - no skip check needed
-            frame = QFrame()
-            fl = QHBoxLayout()
-
-            # Create a container for the test title and description
-            title_container = QWidget()
-            title_layout = QVBoxLayout()
-            title_layout.setContentsMargins(0, 0, 0, 0)
-            title_layout.setSpacing(2)
-
-            # Title label
-            lbl = QLabel(f"{tnum} — {tname}")
-
-            # Description label (smaller, italic)
-            desc_lbl = QLabel(tdesc if tdesc else "")
-            desc_lbl.setStyleSheet("color: #888; font-style: italic; font-size: 11px;")
-            desc_lbl.setWordWrap(True)
-
-            title_layout.addWidget(lbl)
-            if tdesc:
-                title_layout.addWidget(desc_lbl)
-            title_container.setLayout(title_layout)
-
-            # Highlight in red if this test needs retesting
-            if tnum in retest_test_keys:
-                lbl.setStyleSheet("color: #e74c3c; font-weight: bold;")
-                desc_lbl.setStyleSheet("color: #e74c3c; font-style: italic; font-size: 11px;")
-                frame.setStyleSheet("background-color: #fff5f5; border: 1px solid #e74c3c; border-radius: 4px;")
-                lbl.setToolTip("⚠️ This test needs retesting!")
-
-            # create a group of radio buttons for status (exclusive selection)
-            status_widget = QWidget()
-            status_layout = QVBoxLayout()
-            status_layout.setContentsMargins(0, 0, 0, 0)
-            group = QButtonGroup(status_widget)
-            # skip the empty string option; allow no selection initially
-            for opt in STATUS_OPTIONS[1:]:
-                rb = QRadioButton(opt)
-                group.addButton(rb)
-                status_layout.addWidget(rb)
-            status_widget.setLayout(status_layout)
-
-            notes = ImageTextEdit()
-            notes.setMaximumHeight(120)
-
-            # add a small toolbar with a Code button to wrap selection in a code block
-            note_container = QWidget()
-            note_v = QVBoxLayout()
-            note_v.setContentsMargins(0, 0, 0, 0)
-            note_v.addWidget(notes)
-            note_container.setLayout(note_v)
-
-            fl.addWidget(title_container, 2)
-            fl.addWidget(status_widget, 1)
-            fl.addWidget(note_container, 3)
-            frame.setLayout(fl)
-            frame.setProperty('is_retest', tnum in retest_test_keys)  # Store retest status
-            self.form.addWidget(frame)
-            self.test_frames.append(frame)  # Store frame reference for highlighting
-            self.entries.append((tnum, group, notes))
-        self.form.addStretch()
         # populate if existing - use commit-specific lookup
+        current_commit = meta.get('commit', '')
+        saved = self.controller.get_saved_results(version['id'], current_commit)
+
+        # Tests are already filtered by template - no skip check needed.
+        # Hold repaints while the model resets and the editor is placed, so the
+        # view lays out and paints once instead of after every step
+        self.test_view.setUpdatesEnabled(False)
         try:
-            current_commit = self.controller.intro.get_metadata().get('commit', '')
-        except Exception:
-            current_commit = ''
-        saved = get_results_for_version(self.controller.session, version['id'], current_commit)
-        for tnum, group, notes in self.entries:
-            r = saved.get(tnum, {})
-            if r:
-                status = r.get('status', '')
-                # Notes are stored in cleaned format with <pre><code> blocks
-                # Convert to styled HTML for Qt display, handle old thumbnail format too
-                notes_html = r.get('notes', '')
-                notes_html = convert_old_thumbnail_format(notes_html)
-                notes_html = prepare_notes_for_editor(notes_html)
-                notes.setHtml(notes_html)
-                if status:
-                    for b in group.buttons():
-                        if b.text() == status:
-                            b.setChecked(True)
-                            break
+            self.test_model.load(tests_to_show, saved, retest_test_keys)
+            self.test_delegate.current_row = -1
+            self.test_view.scrollToTop()
+            if self.test_model.rowCount():
+                self._open_editor(0)
+        finally:
+            self.test_view.setUpdatesEnabled(True)
+        # The first batch is on screen; expose the remaining rows between event loop passes
+        self._schedule_populate()
+
+    def _schedule_populate(self):
+        if not self._populate_pending:
+            self._populate_pending = True
+            QtCore.QTimer.singleShot(0, self._populate_next_chunk)
+
+    def _populate_next_chunk(self):
+        self._populate_pending = False
+        root = QtCore.QModelIndex()
+        if self.test_model.canFetchMore(root):
+            self.test_model.fetchMore(root)
+            self._schedule_populate()
+
+    def _open_editor(self, row):
+        """Move the row editor to the given row, committing the previously edited row."""
+        if self._editor_index is not None and self._editor_index.isValid() and self._editor_index.row() == row:
+            return self.test_view.indexWidget(QtCore.QModelIndex(self._editor_index))
+        self._close_editor(commit=True)
+        index = self.test_model.index(row)
+        self.test_delegate.editor_row = row
+        self._editor_index = QtCore.QPersistentModelIndex(index)
+        self.test_view.openPersistentEditor(index)
+        return self.test_view.indexWidget(index)
+
+    def _close_editor(self, commit=True):
+        """Close the open row editor, writing its status/notes back to the model first."""
+        if self._editor_index is None:
+            return
+        index = QtCore.QModelIndex(self._editor_index)
+        self._editor_index = None
+        self.test_delegate.editor_row = -1
+        if index.isValid():
+            editor = self.test_view.indexWidget(index)
+            if commit and editor is not None:
+                self.test_delegate.setModelData(editor, self.test_model, index)
+            self.test_view.closePersistentEditor(index)
+            self.test_view.update(index)
+
+    def _current_editor(self):
+        """Return the TestRowEditor for the focused test, opening it if needed."""
+        if not (0 <= self.current_test_index < self.test_model.rowCount()):
+            return None
+        return self._open_editor(self.current_test_index)
+
+    def _on_test_clicked(self, index):
+        self.current_test_index = index.row()
+        self.highlight_current_test()
 
     def _get_stopwatch_seconds(self):
         elapsed = self.stopwatch_elapsed
-        if self.stopwatch_running and self._stopwatch_start:
-            elapsed += (datetime.now() - self._stopwatch_start).total_seconds()
+        if self.stopwatch_running and self._stopwatch_start is not None:
+            elapsed += time.monotonic() - self._stopwatch_start
         return elapsed
 
+    def _on_stopwatch_tick(self):
+        # Nothing to repaint while the test page is hidden; the next tick after it is shown catches up
+        if self.isVisible():
+            self._update_stopwatch_display()
+
     def _update_stopwatch_display(self):
         elapsed = int(self._get_stopwatch_seconds())
+        if elapsed == self._last_stopwatch_seconds:
+            return
+        self._last_stopwatch_seconds = elapsed
         self.stopwatch_label.setText(f"Stopwatch: {self.controller.format_seconds(elapsed)}")
 
     def start_stopwatch(self):
         if self.stopwatch_running:
             return
         self.stopwatch_running = True
-        self._stopwatch_start = datetime.now()
+        # Monotonic clock: unaffected by wall-clock changes while the stopwatch runs
+        self._stopwatch_start = time.monotonic()
         if not self._stopwatch_timer.isActive():
             self._stopwatch_timer.start()
 
     def stop_stopwatch(self):
         if not self.stopwatch_running:
             return
-        self.stopwatch_elapsed += (datetime.now() - self._stopwatch_start).total_seconds()
+        self.stopwatch_elapsed += time.monotonic() - self._stopwatch_start
         self.stopwatch_running = False
         self._stopwatch_start = None
         if self._stopwatch_timer.isActive():
@@ -2615,8 +3511,22 @@ class TestPage(QWidget):
                 "Emulator path not set. Please set it on the intro page.")
             return
 
-        # Find and compress matching log files
-        result = find_and_compress_log_files(emulator_path, packages, max_hours=13)
+        # Find and compress matching log files on a pool thread; the modal
+        # progress dialog keeps the page (and current version) in place meanwhile
+        progress = QProgressDialog("Finding and compressing log files...", None, 0, 0, self)
+        progress.setWindowTitle("Attach Log")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+
+        task = LogCompressTask(emulator_path, packages, max_hours=13)
+        task.signals.finished.connect(lambda result: self._on_logs_compressed(vid, result, progress))
+        self._log_compress_task = task
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_logs_compressed(self, vid, result, progress):
+        self._log_compress_task = None
+        progress.close()
 
         if not result['success']:
             QMessageBox.warning(self, "No Logs Found", result['error'])
@@ -2631,24 +3541,29 @@ class TestPage(QWidget):
         self.controller.session['attached_logs'][vid] = logs
         self.controller.save_session()
 
-        # Show summary
-        total_original = sum(log['size_original'] for log in logs)
-        total_compressed = sum(log['size_compressed'] for log in logs)
+        # Show summary - totals and the filename list in a single pass over the logs
+        total_original = total_compressed = 0
+        parts = []
+        for log in logs:
+            total_original += log['size_original']
+            total_compressed += log['size_compressed']
+            parts.append(f"  • {log['filename']}")
         ratio = (1 - total_compressed / total_original) * 100 if total_original > 0 else 0
 
-        filenames = '\n'.join(f"  • {log['filename']}" for log in logs)
+        filenames = '\n'.join(parts)
         QMessageBox.information(self, "Logs Attached",
             f"Successfully attached {len(logs)} log file(s):\n\n{filenames}\n\n"
             f"Original size: {total_original:,} bytes\n"
             f"Compressed size: {total_compressed:,} bytes\n"
             f"Compression ratio: {ratio:.1f}%")
 
-    def _update_button_visibility(self, version):
+    def _update_button_visibility(self, version, meta=None):
         """Update the visibility of Attach Log and View Attachments buttons based on current state."""
         vid = version['id']
 
         # Get emulator path from intro metadata
-        meta = self.controller.intro.get_metadata()
+        if meta is None:
+            meta = self.controller.intro.get_metadata()
         emulator_path = meta.get('emulator_path', '').strip()
 
         # Hide Attach Log button if emulator path is empty
@@ -2656,34 +3571,39 @@ class TestPage(QWidget):
 
         # Check if this report has been submitted to the API
         # A version is considered submitted if it has an upload hash
-        upload_hashes = self.controller.session.get('upload_hashes', {})
-        is_submitted = vid in upload_hashes
+        is_submitted = self.controller.is_version_submitted(vid)
 
         # Check if panel is configured and online
         has_panel = (self.controller.panel and
                      self.controller.panel.is_configured and
                      not self.controller.offline_mode)
 
-        # Try to find the report ID on the panel and check for attachments
-        show_view_attachments = False
+        # Hide View Attachments until the panel confirms this version's report has logs.
+        # The lookups run on the panel worker; a newer call supersedes any in flight.
+        self.view_attachments_btn.setVisible(False)
         self._current_report_id = None
+        self._report_lookup_seq += 1
 
         if is_submitted and has_panel:
-            try:
-                # Get test type from metadata
-                test_type = 'WAN' if meta.get('WAN') else 'LAN'
-                # Find the report ID for this version (tester resolved from API key)
-                report_id = self.controller.panel.find_report_id(vid, test_type)
-                if report_id:
-                    self._current_report_id = report_id
-                    # Check if there are any attachments
-                    logs = self.controller.panel.get_report_logs(report_id)
-                    if logs:
-                        show_view_attachments = True
-            except Exception:
-                pass
+            seq = self._report_lookup_seq
+            # Get test type from metadata
+            test_type = 'WAN' if meta.get('WAN') else 'LAN'
+            # Find the report ID for this version (tester resolved from API key)
+            self.controller.find_report_id_cached(
+                vid, test_type, lambda report_id: self._on_report_id_found(seq, report_id))
+
+    def _on_report_id_found(self, seq, report_id):
+        if seq != self._report_lookup_seq or not report_id:
+            return
+        self._current_report_id = report_id
+        # Check if there are any attachments
+        self.controller.get_report_logs_cached(
+            report_id, lambda logs: self._on_report_logs_found(seq, logs))
 
-        self.view_attachments_btn.setVisible(show_view_attachments)
+    def _on_report_logs_found(self, seq, logs):
+        if seq != self._report_lookup_seq:
+            return
+        self.view_attachments_btn.setVisible(bool(logs))
 
     def view_attachments(self):
         """Show dialog to view and manage log attachments from the web panel."""
@@ -2712,21 +3632,22 @@ class TestPage(QWidget):
 
         # If dialog reported that attachments were deleted, update button visibility
         if dialog.attachments_modified:
+            self.controller.clear_report_lookup_cache()
             self._update_button_visibility(self.controller.current_version)
 
     def finish(self):
-        # collect
+        # collect - flush the open row editor into the model first
+        self._close_editor(commit=True)
+        model = self.test_model
         results = {}
         has_content = False
-        for tnum, group, notes in self.entries:
-            checked = group.checkedButton()
-            status = checked.text() if checked else ''
-            # Clean notes immediately when saving - this converts code block markers
-            # to proper <pre><code> format and preserves embedded images
-            cleaned_notes = clean_notes(notes.toHtml())
-            results[tnum] = {'status': status, 'notes': cleaned_notes}
-            # Check if this test has any content
-            if status or cleaned_notes.strip():
+        # Walk every test, including rows the view has not fetched yet
+        for row in range(model.total_count()):
+            status = model.status(row)
+            cleaned_notes = model.notes(row)
+            results[model.test_key(row)] = {'status': status, 'notes': cleaned_notes}
+            # Check if this test has any content (no need to look again once one row has)
+            if not has_content and (status or cleaned_notes.strip()):
                 has_content = True
 
         # If no tests have status or notes, discard the report silently
@@ -2753,6 +3674,7 @@ class TestPage(QWidget):
         if 'results' not in self.controller.session:
             self.controller.session['results'] = {}
         self.controller.session['results'][storage_key] = results
+        self.controller._results_cache[(vid, current_commit)] = results
 
         # mark completed with commit-specific key
         if 'completed' not in self.controller.session:
@@ -2786,44 +3708,42 @@ class TestPage(QWidget):
 
     def highlight_current_test(self):
         """Highlight the currently focused test and scroll to it."""
-        if not self.test_frames:
+        count = self.test_model.rowCount()
+        if not count:
             return
 
         # Clamp index to valid range
         if self.current_test_index < 0:
             self.current_test_index = 0
-        if self.current_test_index >= len(self.test_frames):
-            self.current_test_index = len(self.test_frames) - 1
-
-        # Update all frame styles
-        for i, frame in enumerate(self.test_frames):
-            is_retest = frame.property('is_retest')
-            if i == self.current_test_index:
-                # Focused test - blue highlight
-                frame.setStyleSheet("background-color: #e3f2fd; border: 2px solid #2196f3; border-radius: 4px;")
-            elif is_retest:
-                # Retest needed - red highlight
-                frame.setStyleSheet("background-color: #fff5f5; border: 1px solid #e74c3c; border-radius: 4px;")
-            else:
-                # Normal test - no highlight
-                frame.setStyleSheet("")
+        if self.current_test_index >= count:
+            self.current_test_index = count - 1
+
+        # Repaint only the previously and newly focused rows
+        previous = self.test_delegate.current_row
+        self.test_delegate.current_row = self.current_test_index
+        if 0 <= previous < count:
+            self.test_view.update(self.test_model.index(previous))
 
-        # Scroll to the focused test
-        if self.current_test_index < len(self.test_frames):
-            frame = self.test_frames[self.current_test_index]
-            self.scroll.ensureWidgetVisible(frame, 50, 50)
+        # Give the focused test the editor and scroll to it
+        self._open_editor(self.current_test_index)
+        index = self.test_model.index(self.current_test_index)
+        self.test_view.update(index)
+        self.test_view.scrollTo(index, QtWidgets.QAbstractItemView.EnsureVisible)
 
     def next_test(self):
         """Move focus to the next test."""
-        if not self.entries:
+        model = self.test_model
+        if not model.rowCount():
             return
-        if self.current_test_index < len(self.entries) - 1:
+        if self.current_test_index >= model.rowCount() - 1 and model.canFetchMore(QtCore.QModelIndex()):
+            model.fetchMore(QtCore.QModelIndex())
+        if self.current_test_index < model.rowCount() - 1:
             self.current_test_index += 1
             self.highlight_current_test()
 
     def prev_test(self):
         """Move focus to the previous test."""
-        if not self.entries:
+        if not self.test_model.rowCount():
             return
         if self.current_test_index > 0:
             self.current_test_index -= 1
@@ -2835,35 +3755,58 @@ class TestPage(QWidget):
         Args:
             status_index: 1=Working, 2=Semi-working, 3=Not working, 4=N/A
         """
-        if not self.entries or self.current_test_index >= len(self.entries):
+        # Map 1-4 to STATUS_OPTS_UI ("Working", "Semi-working", "Not working", "N/A")
+        if status_index < 1 or status_index > len(STATUS_OPTS_UI):
             return
 
-        # Map 1-4 to STATUS_OPTIONS[1:] (skipping empty string at index 0)
-        # STATUS_OPTIONS = ["", "Working", "Semi-working", "Not working", "N/A"]
-        if status_index < 1 or status_index > 4:
+        editor = self._current_editor()
+        if editor is None:
             return
-
-        tnum, group, notes = self.entries[self.current_test_index]
-        buttons = group.buttons()
-
-        # buttons correspond to STATUS_OPTIONS[1:], so index 0 = Working, 1 = Semi-working, etc.
-        target_index = status_index - 1
-        if target_index < len(buttons):
-            buttons[target_index].setChecked(True)
+        editor.set_status(STATUS_OPTS_UI[status_index - 1])
 
     def focus_current_notes(self):
         """Focus the notes field of the currently focused test."""
-        if not self.entries or self.current_test_index >= len(self.entries):
+        editor = self._current_editor()
+        if editor is None:
             return
-
-        tnum, group, notes = self.entries[self.current_test_index]
-        notes.setFocus()
+        editor.notes.setFocus()
 
 
 class Controller:
     # Path to settings INI file (next to this script)
     SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_tool_settings.ini')
 
+    # Global keyboard shortcuts: (key sequence, Controller method name, *arguments)
+    KEYBOARD_SHORTCUTS = (
+        # Navigation
+        ("Ctrl+1", "_shortcut_goto_intro"),
+        ("Ctrl+2", "show_versions"),
+        ("Ctrl+3", "_shortcut_goto_tests"),     # only if a version is selected
+        ("Ctrl+S", "_shortcut_save"),
+        ("Ctrl+E", "export_report"),
+        ("Ctrl+U", "_shortcut_upload"),
+        ("Ctrl+R", "load_session"),
+        ("Ctrl+T", "_shortcut_check_retests"),
+        ("F5", "_shortcut_refresh"),            # reload/refresh current view
+        ("Ctrl+F", "_shortcut_finish_test"),    # when on tests page
+        ("Escape", "_shortcut_back"),           # go back / cancel
+        ("F1", "_show_shortcuts_help"),
+        ("Ctrl+L", "_shortcut_attach_log"),     # when on tests page
+        ("Alt+Up", "_shortcut_prev_version"),   # navigate list on versions page
+        ("Alt+Down", "_shortcut_next_version"),
+        ("Ctrl+Space", "_shortcut_toggle_timer"),
+        # Test status & navigation, only active on the Tests page
+        # 1/2/3/4: Working/Semi-working/Not working/N/A
+        ("1", "_shortcut_set_status", 1),
+        ("2", "_shortcut_set_status", 2),
+        ("3", "_shortcut_set_status", 3),
+        ("4", "_shortcut_set_status", 4),
+        ("Ctrl+Down", "_shortcut_next_test"),
+        ("Ctrl+Return", "_shortcut_next_test"),
+        ("Ctrl+Up", "_shortcut_prev_test"),
+        ("Ctrl+N", "_shortcut_focus_notes"),    # focus notes field for current test
+    )
+
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.window = QtWidgets.QMainWindow()
@@ -2878,11 +3821,47 @@ class Controller:
         # Offline mode flag - True when API is configured but not reachable
         self.offline_mode = False
 
-        # Track versions pending upload (for hash update after success)
-        self._pending_upload_versions = []
-
-        # Cache for version-specific tests (loaded during navigation, cleared on submission)
-        self._version_tests_cache = {}
+        # Versions pending upload -> hash of the uploaded data (recorded after success)
+        self._pending_upload_hashes = {}
+        # (test_type, commit) of the pending upload, for the server hash check shortcut
+        self._pending_upload_check_key = None
+
+        # Temp file holding the filtered session being uploaded; kept after a
+        # failed submission so an identical retry can reuse it
+        self._pending_upload_path = None
+        self._pending_upload_digest = None
+
+        # Upload progress dialog, created on first upload and reused afterwards
+        self._submission_progress = None
+
+        # Flag polling thread and its stop event, set by _start_flag_polling()
+        self._flag_polling_stop = None
+        self._flag_polling_thread = None
+
+        # LRU cache for version-specific tests: version_id -> (timestamp, tests).
+        # Loaded during navigation, entries expire after VERSION_TESTS_CACHE_TTL, cleared on submission
+        self._version_tests_cache = OrderedDict()
+        # version_id -> time of the last failed lookup, see VERSION_TESTS_FAILURE_TTL
+        self._version_tests_failed = {}
+
+        # Cache of saved results per (version_id, commit), reset whenever session results are replaced
+        self._results_cache = {}
+
+        # Bumped whenever the session is saved, scheduled for saving or reloaded;
+        # _submitted_cache maps version_id -> (session_rev, is_submitted)
+        self._session_rev = 0
+        self._submitted_cache = {}
+        # (tested_ids, vid_to_results) for reports, valid while _tested_index_rev == _session_rev
+        self._tested_index = None
+        self._tested_index_rev = -1
+        # (versions_list, version_packages) for save_session; the active versions
+        # list is replaced, never mutated, when versions are reloaded
+        self._version_packages = None
+
+        # Short-lived panel lookups for the test page's attachments button:
+        # (version_id, test_type) -> (timestamp, report_id) and report_id -> (timestamp, logs)
+        self._report_id_cache = {}
+        self._report_logs_cache = {}
 
         self.last_completed_version = None
         self.intro = IntroPage()
@@ -2918,14 +3897,34 @@ class Controller:
         self.current_version = None
         self.last_completed_version = None
         # timing: accumulated seconds per version is stored in session['timing']
-        # runtime-only: current running version id and start timestamp
+        # runtime-only: current running version id and its time.monotonic() start
         self.timer_running_version = None
         self._timer_start = None
+        # sum of session['timing'], recomputed only when the timing dict changes
+        self._timing_total_stopped = 0
         # QTimer to tick every second and update UI
         self._tick_timer = QtCore.QTimer()
         self._tick_timer.timeout.connect(self._tick)
         self._tick_timer.start(1000)
 
+        # Debounced session writer: schedule_save_session() coalesces writes into one flush
+        self._session_dirty = False
+        self._save_timer = QtCore.QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SESSION_SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._flush_session)
+        # Session files are written off the GUI thread, one at a time and in order
+        self._session_write_pool = QtCore.QThreadPool()
+        self._session_write_pool.setMaxThreadCount(1)
+        self._session_write_seq = 0
+        # digest of the bytes in the newest queued write to session_results.json;
+        # saves that would queue identical bytes are dropped
+        self._session_queued_digest = None
+        self.app.aboutToQuit.connect(self._flush_session)
+        self.app.aboutToQuit.connect(self._session_write_pool.waitForDone)
+        self.app.aboutToQuit.connect(self._remove_pending_upload_file)
+        self.app.aboutToQuit.connect(self._stop_flag_polling)
+
         # try load session
         self.load_session()
 
@@ -3113,7 +4112,7 @@ class Controller:
         """
         global TESTS
         try:
-            if success and result and hasattr(result, 'success') and result.success and result.tests:
+            if success and result and result.success and result.tests:
                 # Convert API tests to the same format as FALLBACK_TESTS
                 new_tests = []
                 for test in result.tests:
@@ -3133,7 +4132,7 @@ class Controller:
                     self.offline_mode = False
             else:
                 # No tests available from API or cache
-                error = result.error if hasattr(result, 'error') and result.error else str(result) if result else "Unknown error"
+                error = result_error(result)
                 print(f"Failed to load tests: {error}, using fallback tests")
                 TESTS = list(FALLBACK_TESTS)
                 self.offline_mode = True
@@ -3165,7 +4164,8 @@ class Controller:
         """Get tests for a specific version using version-specific template if assigned.
 
         Uses in-memory cache to avoid repeated API calls during navigation.
-        Cache is cleared on report submission to get fresh data.
+        Cache is cleared on report submission to get fresh data. Failed lookups are
+        not retried for VERSION_TESTS_FAILURE_TTL seconds.
 
         Args:
             version_id: The client version string (e.g., 'secondblob.bin.2004-01-15')
@@ -3180,8 +4180,17 @@ class Controller:
             return None, None
 
         # Check in-memory cache first (unless force refresh requested)
-        if not force_refresh and version_id in self._version_tests_cache:
-            return self._version_tests_cache[version_id], None
+        entry = self._version_tests_cache.get(version_id)
+        if entry is not None and not force_refresh:
+            if time.monotonic() - entry[0] < VERSION_TESTS_CACHE_TTL:
+                self._version_tests_cache.move_to_end(version_id)
+                return entry[1], None
+            del self._version_tests_cache[version_id]
+        failed_at = self._version_tests_failed.get(version_id)
+        if failed_at is not None and not force_refresh:
+            if time.monotonic() - failed_at < VERSION_TESTS_FAILURE_TTL:
+                return None, None
+            del self._version_tests_failed[version_id]
 
         try:
             result = self.panel.get_tests(enabled_only=True, client_version=version_id)
@@ -3204,19 +4213,46 @@ class Controller:
                     print(f"Using cached tests for version {version_id} ({len(tests)} tests)")
 
                 # Cache the result for subsequent accesses
-                self._version_tests_cache[version_id] = tests
+                self._version_tests_cache[version_id] = (time.monotonic(), tests)
+                self._version_tests_cache.move_to_end(version_id)
+                limit = max(VERSION_TESTS_CACHE_SIZE, len(get_active_versions()))
+                while len(self._version_tests_cache) > limit:
+                    self._version_tests_cache.popitem(last=False)
 
                 # skip_tests is deprecated - templates now control test visibility
                 # Return None for skip_tests for backward compatibility
                 return tests, None
+            self._version_tests_failed[version_id] = time.monotonic()
             return None, None
         except Exception as e:
             print(f"Error getting tests for version {version_id}: {e}")
+            self._version_tests_failed[version_id] = time.monotonic()
             return None, None
 
     def clear_version_tests_cache(self):
         """Clear the in-memory version tests cache. Called after report submission."""
-        self._version_tests_cache = {}
+        self._version_tests_cache.clear()
+        self._version_tests_failed.clear()
+
+    @staticmethod
+    def _versions_to_dicts(versions):
+        """Convert API ClientVersion objects to the same format as VERSIONS.
+
+        Notifications stay as the client's VersionNotification objects;
+        get_version_notifications_for_display() converts the few that are shown.
+        """
+        return [
+            {
+                'id': v.id,
+                'packages': v.packages or [],
+                'steam_date': v.steam_date,
+                'steam_time': v.steam_time,
+                'skip_tests': [],  # Deprecated: templates control test visibility
+                'display_name': v.display_name,
+                'notifications': list(v.notifications or ())
+            }
+            for v in versions
+        ]
 
     def _load_versions_from_api(self):
         """Load client versions from the API and update the global API_VERSIONS list.
@@ -3234,31 +4270,7 @@ class Controller:
             # Get versions with notifications included (uses cache if offline)
             result = self.panel.get_versions(enabled_only=True, include_notifications=True)
             if result and result.success and result.versions:
-                # Convert API ClientVersion objects to the same format as VERSIONS
-                new_versions = []
-                for v in result.versions:
-                    version_dict = {
-                        'id': v.id,
-                        'packages': v.packages or [],
-                        'steam_date': v.steam_date,
-                        'steam_time': v.steam_time,
-                        'skip_tests': [],  # Deprecated: templates control test visibility
-                        'display_name': v.display_name,
-                        'notifications': []
-                    }
-                    # Add notifications
-                    if v.notifications:
-                        for n in v.notifications:
-                            version_dict['notifications'].append({
-                                'id': n.id,
-                                'name': n.name,
-                                'message': n.message,
-                                'commit_hash': n.commit_hash,
-                                'created_at': n.created_at
-                            })
-                    new_versions.append(version_dict)
-
-                API_VERSIONS = new_versions
+                API_VERSIONS = self._versions_to_dicts(result.versions)
 
                 # Check if this is cached data (offline mode)
                 if result.error and "cached" in result.error.lower():
@@ -3304,32 +4316,8 @@ class Controller:
         """Callback handler for async versions loading."""
         global API_VERSIONS
         try:
-            if success and result and hasattr(result, 'success') and result.success and result.versions:
-                # Convert API ClientVersion objects to the same format as VERSIONS
-                new_versions = []
-                for v in result.versions:
-                    version_dict = {
-                        'id': v.id,
-                        'packages': v.packages or [],
-                        'steam_date': v.steam_date,
-                        'steam_time': v.steam_time,
-                        'skip_tests': [],  # Deprecated: templates control test visibility
-                        'display_name': v.display_name,
-                        'notifications': []
-                    }
-                    # Add notifications
-                    if v.notifications:
-                        for n in v.notifications:
-                            version_dict['notifications'].append({
-                                'id': n.id,
-                                'name': n.name,
-                                'message': n.message,
-                                'commit_hash': n.commit_hash,
-                                'created_at': n.created_at
-                            })
-                    new_versions.append(version_dict)
-
-                API_VERSIONS = new_versions
+            if success and result and result.success and result.versions:
+                API_VERSIONS = self._versions_to_dicts(result.versions)
 
                 # Check if this is cached data (offline mode)
                 if result.error and "cached" in result.error.lower():
@@ -3342,7 +4330,7 @@ class Controller:
                 if total_notifs > 0:
                     print(f"  (includes {total_notifs} version notifications)")
             else:
-                error = result.error if hasattr(result, 'error') and result.error else str(result) if result else "Unknown error"
+                error = result_error(result)
                 print(f"Failed to load versions: {error}, using fallback versions from file")
                 API_VERSIONS = None
         except Exception as e:
@@ -3357,8 +4345,8 @@ class Controller:
         msg.setText("Could not connect to the Test Panel API.")
 
         # Check if cached data is available
-        has_cache = self.panel and self.panel.has_cached_data() if hasattr(self.panel, 'has_cached_data') else False
-        pending_count = self.panel.get_pending_submissions_count() if self.panel and hasattr(self.panel, 'get_pending_submissions_count') else 0
+        has_cache = self.panel.has_cached_data() if self.panel else False
+        pending_count = self.panel.get_pending_submissions_count() if self.panel else 0
 
         if has_cache:
             info_text = (
@@ -3422,14 +4410,14 @@ class Controller:
     def _on_user_info_loaded(self, success: bool, result):
         """Callback handler for async user info loading."""
         try:
-            if success and result and hasattr(result, 'success') and result.success:
+            if success and result and result.success:
                 # Set tester name only if field is empty
                 if not self.intro.name_input.text().strip() and result.username:
                     self.intro.name_input.setText(result.username)
                     print(f"Loaded tester name from API: {result.username}")
 
                 # Populate revisions dropdown
-                if hasattr(result, 'revisions') and result.revisions:
+                if result.revisions:
                     self.intro.populate_revisions(result.revisions)
                     print(f"Loaded {len(result.revisions)} revisions from API")
         except Exception as e:
@@ -3503,6 +4491,7 @@ class Controller:
 
             existing = self.session['results'][storage_key]
 
+            merged = False
             for test_key, test_data in report_results.items():
                 # Only fill in tests that don't already have local results
                 if test_key not in existing or not existing[test_key].get('status'):
@@ -3511,8 +4500,13 @@ class Controller:
                         'notes': test_data.get('notes', ''),
                     }
                     loaded_count += 1
+                    merged = True
+            # the session is already at SESSION_SCHEMA_VERSION, so migrate merged results here
+            if merged:
+                self._migrate_legacy_test12_result(existing)
 
         if loaded_count > 0:
+            self._results_cache.clear()
             self.save_session()
             print(f"Loaded {loaded_count} test result(s) from {len(reports)} API report(s)")
 
@@ -3526,30 +4520,24 @@ class Controller:
         """Handle submission complete signal from panel."""
         if success:
             # Update upload hashes for successfully uploaded versions
-            if hasattr(self, '_pending_upload_versions') and self._pending_upload_versions:
-                results = self.session.get('results', {})
-                attached_logs = self.session.get('attached_logs', {})
-
-                if 'upload_hashes' not in self.session:
-                    self.session['upload_hashes'] = {}
-
-                for storage_key in self._pending_upload_versions:
-                    vid_results = results.get(storage_key, {})
-                    # Extract original vid for attached_logs lookup (may be 'vid' or 'vid|commit')
-                    original_vid, _ = parse_version_storage_key(storage_key)
-                    vid_logs = attached_logs.get(original_vid, [])
-                    self.session['upload_hashes'][storage_key] = compute_version_hash(vid_results, vid_logs)
-
-                self._pending_upload_versions = []
-                self.save_session()
+            if self._pending_upload_hashes:
+                # Hashes were computed from the exact data that was uploaded
+                self.session.setdefault('upload_hashes', {}).update(self._pending_upload_hashes)
+                self._pending_upload_hashes = {}
+                # Everything uploaded is now on the server for this test type and commit
+                # (a submission queued while offline has no report id and isn't)
+                if report_id is not None and self._pending_upload_check_key is not None:
+                    test_type, commit_hash = self._pending_upload_check_key
+                    self.session['last_server_check'] = {
+                        'ts': time.time(), 'test_type': test_type, 'commit': commit_hash}
+                self._pending_upload_check_key = None
+                self.schedule_save_session()
 
             # Clean up temp upload file
-            try:
-                filtered_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'session_results_upload.json')
-                if os.path.exists(filtered_path):
-                    os.remove(filtered_path)
-            except Exception:
-                pass
+            self._remove_pending_upload_file()
+
+            # The upload may have created a report or attached new logs
+            self.clear_report_lookup_cache()
 
             # Clear version tests cache and refresh data from API asynchronously
             self.clear_version_tests_cache()
@@ -3557,22 +4545,33 @@ class Controller:
             self._load_versions_from_api_async()
 
             # Update progress dialog to show success
-            if hasattr(self, '_submission_progress') and self._submission_progress:
+            if self._submission_progress is not None:
                 self._submission_progress.set_complete(True, message)
             else:
                 QMessageBox.information(self.window, "Upload Complete",
                     f"Report uploaded successfully!\n\n{message}")
         else:
             # Clear pending versions on failure so user can retry
-            self._pending_upload_versions = []
+            self._pending_upload_hashes = {}
+            self._pending_upload_check_key = None
 
             # Update progress dialog to show failure
-            if hasattr(self, '_submission_progress') and self._submission_progress:
+            if self._submission_progress is not None:
                 self._submission_progress.set_complete(False, message)
             else:
                 QMessageBox.warning(self.window, "Upload Failed",
                     f"Failed to upload report:\n\n{message}")
 
+    def _remove_pending_upload_file(self):
+        """Delete the temp file written for the last upload, if any."""
+        if self._pending_upload_path:
+            try:
+                os.remove(self._pending_upload_path)
+            except OSError:
+                pass
+            self._pending_upload_path = None
+            self._pending_upload_digest = None
+
     def _on_flag_notification(self, count, flags):
         """Handle flag notification signal from panel polling thread."""
         if count > 0 and flags:
@@ -3584,23 +4583,21 @@ class Controller:
                 # Show retest notification dialog
                 dialog = FlagNotificationDialog(self.window, 'retest', retest_flags)
                 if dialog.exec_() == QDialog.Accepted:
-                    # User acknowledged - send acknowledgement to server asynchronously
-                    for flag in retest_flags:
-                        try:
-                            self.panel.acknowledge_flag_async('retest', flag.get('id'))
-                        except Exception as e:
-                            print(f"Failed to acknowledge retest flag: {e}")
+                    # User acknowledged - send one acknowledgement for all of them asynchronously
+                    try:
+                        self.panel.acknowledge_flags_async('retest', [f.get('id') for f in retest_flags])
+                    except Exception as e:
+                        print(f"Failed to acknowledge retest flags: {e}")
 
             if fixed_flags:
                 # Show fixed notification dialog
                 dialog = FlagNotificationDialog(self.window, 'fixed', fixed_flags)
                 if dialog.exec_() == QDialog.Accepted:
-                    # User acknowledged - send acknowledgement to server asynchronously
-                    for flag in fixed_flags:
-                        try:
-                            self.panel.acknowledge_flag_async('fixed', flag.get('id'))
-                        except Exception as e:
-                            print(f"Failed to acknowledge fixed flag: {e}")
+                    # User acknowledged - send one acknowledgement for all of them asynchronously
+                    try:
+                        self.panel.acknowledge_flags_async('fixed', [f.get('id') for f in fixed_flags])
+                    except Exception as e:
+                        print(f"Failed to acknowledge fixed flags: {e}")
 
     def _start_flag_polling(self):
         """Start background thread for polling flag notifications."""
@@ -3613,32 +4610,46 @@ class Controller:
         self._flag_polling_thread.start()
 
     def _stop_flag_polling(self):
-        """Stop the background flag polling thread."""
-        if hasattr(self, '_flag_polling_stop'):
+        """Stop the background flag polling thread.
+
+        The thread may be in the middle of a request, so it is not joined; it is
+        a daemon, stops as soon as that request returns and never emits after
+        being stopped.
+        """
+        if self._flag_polling_stop is not None:
             self._flag_polling_stop.set()
-        if hasattr(self, '_flag_polling_thread') and self._flag_polling_thread.is_alive():
-            self._flag_polling_thread.join(timeout=2.0)
 
     def _flag_polling_loop(self):
-        """Background thread that polls for flag notifications periodically."""
-        import time
-        poll_interval = 30  # Check every 30 seconds
+        """Background thread that polls for flag notifications.
+
+        Each request sends the etag of the last flag set seen; while the panel
+        reports it unchanged nothing is emitted and the interval doubles up to
+        FLAG_POLL_MAX_INTERVAL. A changed set (or a failed request) goes back
+        to FLAG_POLL_INTERVAL.
+        """
+        since = None
+        interval = FLAG_POLL_INTERVAL
 
         while not self._flag_polling_stop.is_set():
             try:
                 if self.panel and self.panel.is_configured:
-                    result = self.panel.check_flags_lightweight()
-                    if result and result.get('success'):
-                        count = result.get('count', 0)
-                        flags = result.get('flags', [])
-                        if count > 0:
-                            # Emit signal to main thread (Qt signals are thread-safe)
-                            self.panel.flag_notification.emit(count, flags)
+                    result = self.panel.check_flags_lightweight(since=since)
+                    if result and result.get('success') and result.get('unchanged'):
+                        interval = min(interval * 2, FLAG_POLL_MAX_INTERVAL)
+                    else:
+                        interval = FLAG_POLL_INTERVAL
+                        if result and result.get('success'):
+                            since = result.get('etag')
+                            count = result.get('count', 0)
+                            flags = result.get('flags', [])
+                            if count > 0 and not self._flag_polling_stop.is_set():
+                                # Emit signal to main thread (Qt signals are thread-safe)
+                                self.panel.flag_notification.emit(count, flags)
             except Exception as e:
                 print(f"Flag polling error: {e}")
 
-            # Wait for next poll interval or until stop is requested
-            self._flag_polling_stop.wait(poll_interval)
+            # Wait before the next request or until stop is requested
+            self._flag_polling_stop.wait(interval)
 
     def show_tests_for(self, version):
         # Check for notifications for this version before showing tests
@@ -3664,14 +4675,18 @@ class Controller:
 
     def get_time_info(self, version_id):
         # return (version_seconds, total_seconds)
-        timing = self.session.get('timing', {})
-        base = int(timing.get(version_id, 0))
+        base = int(self.session.get('timing', {}).get(version_id, 0))
         running_extra = 0
-        if self.timer_running_version == version_id and self._timer_start:
-            running_extra = int((datetime.now() - self._timer_start).total_seconds())
-        version_seconds = base + running_extra
-        total = sum(int(v) for v in timing.values()) + (int((datetime.now() - self._timer_start).total_seconds()) if self._timer_start and self.timer_running_version else 0)
-        return version_seconds, total
+        if self.timer_running_version and self._timer_start is not None:
+            running_extra = int(time.monotonic() - self._timer_start)
+        version_extra = running_extra if self.timer_running_version == version_id else 0
+        return base + version_extra, self._timing_total_stopped + running_extra
+
+    def _recompute_timing_total(self):
+        try:
+            self._timing_total_stopped = sum(int(v) for v in self.session.get('timing', {}).values())
+        except Exception:
+            self._timing_total_stopped = 0
 
     def _tick(self):
         # update UI timing labels when on test page
@@ -3680,8 +4695,7 @@ class Controller:
             vsec, tot = self.get_time_info(vid)
             timestr = f"<br><small>Time on this version: {self.format_seconds(vsec)} — Total testing time: {self.format_seconds(tot)}</small>"
             # preserve the original header content (version & packages)
-            base = f"Version: {self.current_version['id']} — Packages: {', '.join(self.current_version.get('packages', []))}"
-            self.tests.header.setText(base + timestr)
+            self.tests.header.setText(self.tests.header_base + timestr)
 
     def start_timer(self, version_id):
         # if already running on this version do nothing
@@ -3691,17 +4705,18 @@ class Controller:
         if self.timer_running_version is not None:
             self.stop_timer()
         self.timer_running_version = version_id
-        self._timer_start = datetime.now()
+        self._timer_start = time.monotonic()
 
     def stop_timer(self):
-        if not self.timer_running_version or not self._timer_start:
+        if not self.timer_running_version or self._timer_start is None:
             self.timer_running_version = None
             self._timer_start = None
             return
-        elapsed = int((datetime.now() - self._timer_start).total_seconds())
+        elapsed = int(time.monotonic() - self._timer_start)
         if 'timing' not in self.session:
             self.session['timing'] = {}
         self.session['timing'][self.timer_running_version] = int(self.session['timing'].get(self.timer_running_version, 0)) + elapsed
+        self._recompute_timing_total()
         # clear running state
         self.timer_running_version = None
         self._timer_start = None
@@ -3713,34 +4728,51 @@ class Controller:
                 text = f.read()
         except Exception:
             return False
-        # robust replace or append: handle existing values like 2004/10/01 or 00:00:01,
-        # and tolerate leading/trailing whitespace around the key and '='
-        date_pattern = r'^(?P<prefix>\s*steam_date\s*=\s*).*$'
-        time_pattern = r'^(?P<prefix>\s*steam_time\s*=\s*).*$'
-
-        if re.search(date_pattern, text, flags=re.MULTILINE):
-            text = re.sub(date_pattern, lambda m: f"{m.group('prefix')}{steam_date}", text, flags=re.MULTILINE)
-        else:
+        # robust replace or append: one subn() pass per key both replaces and
+        # reports whether the key was present
+        text, found = EMULATOR_INI_DATE_PATTERN.subn(lambda m: f"{m.group('prefix')}{steam_date}", text)
+        if not found:
             text += f"\nsteam_date={steam_date}\n"
 
-        if re.search(time_pattern, text, flags=re.MULTILINE):
-            text = re.sub(time_pattern, lambda m: f"{m.group('prefix')}{steam_time}", text, flags=re.MULTILINE)
-        else:
+        text, found = EMULATOR_INI_TIME_PATTERN.subn(lambda m: f"{m.group('prefix')}{steam_time}", text)
+        if not found:
             text += f"steam_time={steam_time}\n"
 
-        # make a backup before overwriting
+        # make a backup before overwriting - a hard link to the current file is
+        # enough, since the new content replaces ini_path instead of rewriting it
+        backup_path = ini_path + '.bak'
         try:
-            shutil.copy2(ini_path, ini_path + '.bak')
+            if os.path.lexists(backup_path):
+                os.remove(backup_path)
+            os.link(ini_path, backup_path)
         except Exception:
-            pass
+            try:
+                shutil.copy2(ini_path, backup_path)
+            except Exception:
+                pass
         try:
-            with open(ini_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            # Same line endings a text-mode write would produce
+            data = text.replace('\n', os.linesep).encode('utf-8')
+            atomic_write_bytes(ini_path, data, fsync=True)
             return True
         except Exception:
             return False
 
+    def schedule_save_session(self):
+        """Mark the session dirty and write it once after a short debounce."""
+        self._session_rev += 1
+        self._session_dirty = True
+        self._save_timer.start()
+
+    def _flush_session(self):
+        """Write the session if a scheduled save is still pending."""
+        if self._session_dirty:
+            self.save_session()
+
     def save_session(self):
+        self._session_rev += 1
+        self._session_dirty = False
+        self._save_timer.stop()
         try:
             # persist current metadata (tester, commit, WAN/LAN, emulator_path)
             try:
@@ -3759,34 +4791,104 @@ class Controller:
             # Build version_packages mapping for all tested versions
             # This maps version IDs to their Steam/SteamUI package versions
             try:
-                version_packages = {}
-                for v in get_active_versions():
-                    vid = v['id']
-                    packages = v.get('packages', [])
-                    steam_ver = None
-                    steamui_ver = None
-                    for pkg in packages:
-                        if pkg.startswith('Steam_'):
-                            steam_ver = pkg.split('_', 1)[1]
-                        elif pkg.startswith('SteamUI_'):
-                            steamui_ver = pkg.split('_', 1)[1]
-                        elif pkg.startswith('Platform_'):
-                            # Platform packages are equivalent to SteamUI for early versions
-                            steamui_ver = pkg.split('_', 1)[1]
-                    version_packages[vid] = {
-                        'steam_pkg_version': steam_ver,
-                        'steamui_version': steamui_ver
-                    }
-                self.session['version_packages'] = version_packages
+                self.session['version_packages'] = self._version_packages_for(get_active_versions())
             except Exception:
                 pass
 
-            with open('session_results.json', 'w', encoding='utf-8') as f:
-                json.dump(self.session, f, indent=2)
+            # Serialize here so the snapshot is consistent; the disk write and fsync
+            # happen on the session write pool
+            data = dump_json_bytes(self.session)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest == self._session_queued_digest and os.path.isfile('session_results.json'):
+                # same bytes as the newest queued write, which ends up on disk either way
+                return
+            self._session_queued_digest = digest
+            self._session_write_seq += 1
+            self._session_write_pool.start(
+                SessionWriteTask(self, self._session_write_seq, 'session_results.json', data))
         except Exception:
             pass
 
+    def _version_packages_for(self, versions):
+        """version_id -> Steam/SteamUI package versions, rebuilt only when the versions list is replaced."""
+        if self._version_packages is not None and self._version_packages[0] is versions:
+            return self._version_packages[1]
+        version_packages = {}
+        for v in versions:
+            entry = {'steam_pkg_version': None, 'steamui_version': None}
+            for pkg in v.get('packages', []):
+                prefix, sep, ver = pkg.partition('_')
+                field = PACKAGE_PREFIX_FIELDS.get(prefix) if sep else None
+                if field:
+                    entry[field] = ver
+            version_packages[v['id']] = entry
+        self._version_packages = (versions, version_packages)
+        return version_packages
+
+    def get_saved_results(self, vid, commit_hash=None):
+        """Memoized get_results_for_version() for the current session."""
+        key = (vid, commit_hash or '')
+        saved = self._results_cache.get(key)
+        if saved is None:
+            saved = get_results_for_version(self.session, vid, commit_hash)
+            self._results_cache[key] = saved
+        return saved
+
+    def find_report_id_cached(self, vid, test_type, callback):
+        """panel.find_report_id_async() reused for REPORT_LOOKUP_CACHE_TTL seconds.
+
+        callback(report_id) runs on the GUI thread; report_id is None if there is no report.
+        """
+        key = (vid, test_type)
+        entry = self._report_id_cache.get(key)
+        if entry and time.monotonic() - entry[0] < REPORT_LOOKUP_CACHE_TTL:
+            callback(entry[1])
+            return
+
+        def on_result(success, result):
+            if success or result is None:
+                # A found id, or a definite "no report" - errors are not cached
+                self._report_id_cache[key] = (time.monotonic(), result if success else None)
+            callback(result if success else None)
+
+        self.panel.find_report_id_async(vid, test_type, callback=on_result)
+
+    def get_report_logs_cached(self, report_id, callback):
+        """panel.get_report_logs_async() reused for REPORT_LOOKUP_CACHE_TTL seconds.
+
+        callback(logs) runs on the GUI thread; logs is an empty list on failure.
+        """
+        entry = self._report_logs_cache.get(report_id)
+        if entry and time.monotonic() - entry[0] < REPORT_LOOKUP_CACHE_TTL:
+            callback(entry[1])
+            return
+
+        def on_result(success, result):
+            logs = (result or []) if success else []
+            if success:
+                self._report_logs_cache[report_id] = (time.monotonic(), logs)
+            callback(logs)
+
+        self.panel.get_report_logs_async(report_id, callback=on_result)
+
+    def clear_report_lookup_cache(self):
+        """Forget cached report ids and log lists (after uploads or attachment changes)."""
+        self._report_id_cache.clear()
+        self._report_logs_cache.clear()
+
+    def is_version_submitted(self, vid):
+        """True if the version has an upload hash, reusing the answer until the session changes."""
+        entry = self._submitted_cache.get(vid)
+        if entry and entry[0] == self._session_rev:
+            return entry[1]
+        submitted = vid in self.session.get('upload_hashes', {})
+        self._submitted_cache[vid] = (self._session_rev, submitted)
+        return submitted
+
     def load_session(self):
+        self._session_rev += 1
+        self._session_queued_digest = None
+        self._results_cache.clear()
         if os.path.isfile('session_results.json'):
             try:
                 with open('session_results.json', 'r', encoding='utf-8') as f:
@@ -3795,11 +4897,14 @@ class Controller:
                 self.session = {}
         else:
             self.session = {}
-        # migrate legacy results for test 12 -> 12a notes
+        # migrate legacy results for test 12 -> 12a notes; schema_version records
+        # that the migrations ran, so later loads skip them (persisted with the next save)
         try:
             self._migrate_legacy_test12_notes()
+            self.session['schema_version'] = SESSION_SCHEMA_VERSION
         except Exception:
             pass
+        self._recompute_timing_total()
         # if session contains metadata, prefill intro fields
         try:
             meta = self.session.get('meta', {})
@@ -3822,24 +4927,31 @@ class Controller:
             pass
 
     def _migrate_legacy_test12_notes(self):
+        if self.session.get('schema_version', 0) >= 1:
+            return
         results = self.session.get('results', {})
         if not isinstance(results, dict):
             return
         for _, tests in results.items():
-            if not isinstance(tests, dict):
-                continue
-            legacy = tests.get('12')
-            if not isinstance(legacy, dict):
-                continue
-            legacy_notes = legacy.get('notes', '')
-            if not legacy_notes:
-                continue
-            target = tests.get('12a')
-            if not isinstance(target, dict):
-                tests['12a'] = {'status': '', 'notes': legacy_notes}
-                continue
-            if not target.get('notes'):
-                target['notes'] = legacy_notes
+            self._migrate_legacy_test12_result(tests)
+
+    @staticmethod
+    def _migrate_legacy_test12_result(tests):
+        """Move legacy test 12 notes to 12a within one version's results."""
+        if not isinstance(tests, dict):
+            return
+        legacy = tests.get('12')
+        if not isinstance(legacy, dict):
+            return
+        legacy_notes = legacy.get('notes', '')
+        if not legacy_notes:
+            return
+        target = tests.get('12a')
+        if not isinstance(target, dict):
+            tests['12a'] = {'status': '', 'notes': legacy_notes}
+            return
+        if not target.get('notes'):
+            target['notes'] = legacy_notes
 
     def restart_session(self):
         # confirm with the user
@@ -3853,6 +4965,8 @@ class Controller:
             self.stop_timer()
         except Exception:
             pass
+        # Let queued session writes land before the file is deleted
+        self._session_write_pool.waitForDone()
         try:
             if os.path.isfile('session_results.json'):
                 os.remove('session_results.json')
@@ -3871,121 +4985,77 @@ class Controller:
         path, _ = QFileDialog.getSaveFileName(self.window, "Save report as", default_name, "HTML Files (*.html)")
         if not path:
             return
-        html = self.build_html_report(meta)
+        # Stream the report into a temp file next to the target, then move it into place
+        tmp_path = path + '.tmp'
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(html)
+            with open(tmp_path, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+                self.build_html_report(meta, out=f)
+            os.replace(tmp_path, path)
             QMessageBox.information(self.window, "Exported", f"Report saved to {path}")
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             QMessageBox.warning(self.window, "Error", f"Failed to save report: {e}")
 
-    def build_html_report(self, meta):
+    def _tested_version_index(self):
+        """Return (tested_ids, vid_to_results) for the session, rebuilt only after it changes.
+
+        Keys may be 'vid' or 'vid|commit'; both sets are in terms of the original vid.
+        """
+        if self._tested_index_rev == self._session_rev and self._tested_index is not None:
+            return self._tested_index
+
+        parse = parse_version_storage_key
+        completed_ids = {parse(k)[0] for k, v in self.session.get('completed', {}).items() if v}
+
+        # Build a lookup that maps plain vid to results (handles both 'vid' and 'vid|commit' keys)
+        # If multiple commits have results for same vid, later keys overwrite earlier ones
+        vid_to_results = {parse(k)[0]: v for k, v in self.session.get('results', {}).items()}
+
+        self._tested_index = (completed_ids | vid_to_results.keys(), vid_to_results)
+        self._tested_index_rev = self._session_rev
+        return self._tested_index
+
+    def build_html_report(self, meta, out=None):
+        """Write the HTML report to the text stream out, or return it as a string if out is None."""
         now = datetime.now().strftime("%b %d, %Y %I:%M:%S %p")
-        results = self.session.get('results', {})
         timing = self.session.get('timing', {})
         # include running extra time if a timer is active
         running_extra = 0
         running_vid = self.timer_running_version
-        if running_vid and self._timer_start:
-            running_extra = int((datetime.now() - self._timer_start).total_seconds())
+        if running_vid and self._timer_start is not None:
+            running_extra = int(time.monotonic() - self._timer_start)
 
         # only include versions that were tested/completed or have results saved
-        # Note: keys may be 'vid' or 'vid|commit' - extract original vid for matching
-        completed_ids = set()
-        for k, v in self.session.get('completed', {}).items():
-            if v:
-                original_vid, _ = parse_version_storage_key(k)
-                completed_ids.add(original_vid)
-
-        saved_ids = set()
-        # Build a lookup that maps plain vid to results (handles both 'vid' and 'vid|commit' keys)
-        # If multiple commits have results for same vid, we use the first one found (newest is likely last)
-        vid_to_results = {}
-        for k, v in results.items():
-            original_vid, _ = parse_version_storage_key(k)
-            saved_ids.add(original_vid)
-            # Store results for this vid (later keys will overwrite earlier ones)
-            vid_to_results[original_vid] = v
-
-        tested_ids = completed_ids | saved_ids
-
-        # compute total time across tested versions (include running timer if active)
-        total_all = 0
-        for v in get_active_versions():
-            vid = v['id']
-            if vid not in tested_ids:
-                continue
-            sec = int(timing.get(vid, 0))
-            if running_vid == vid:
-                sec += running_extra
-            total_all += sec
-
-        html = ["<html><head><meta charset='utf-8'><title>Steam Emulator Test Report</title>",
-                "<style>"
-                ":root{--text:#222;--muted:#666;--border:#ccc;--bg:#f5f5f5;}"
-                "body{font-family:Segoe UI,Arial,sans-serif;font-size:14px;color:var(--text);line-height:1.35;margin:20px;}"
-                "h1{font-size:22px;margin:0 0 8px;}"
-                "h2{font-size:18px;margin:18px 0 6px;}"
-                "p{margin:4px 0 8px;}"
-                "table{border-collapse:collapse;width:100%;font-size:13px;}"
-                "th,td{border:1px solid var(--border);padding:6px;vertical-align:top;}"
-                "th{background:var(--bg);text-align:left;}"
-                ".meta{font-size:13px;color:var(--muted);}"
-                ".notes{font-size:13px;line-height:1.35;}"
-                ".notes *{font-size:inherit !important;line-height:inherit;}"
-                ".notes pre{background:#fdf6e3;color:#333;font-family:Consolas,'Courier New',monospace;font-size:12px;line-height:1.4;padding:8px;border-radius:6px;white-space:pre-wrap;overflow-x:auto;margin:6px 0;}"
-                ".notes pre code{font-size:inherit;background:none;padding:0;}"
-                ".notes img{max-width:125px;height:auto;cursor:pointer;border:1px solid var(--border);border-radius:3px;}"
-                "details.version{border:1px solid #e5e5e5;border-radius:6px;padding:10px;margin:12px 0;background:#fafafa;}"
-                "details.version[open]{background:#fff;}"
-                "details.version summary{cursor:pointer;font-weight:600;font-size:15px;list-style:none;}"
-                "details.version summary::-webkit-details-marker{display:none;}"
-                "details.version summary:before{content:'▸';display:inline-block;margin-right:6px;color:#666;}"
-                "details.version[open] summary:before{content:'▾';}"
-                ".matrix-wrap{overflow:auto;max-width:100%;margin-top:6px;}"
-                ".matrix th{position:sticky;top:0;background:#fff;z-index:2;}"
-                ".matrix th:first-child{left:0;z-index:3;}"
-                ".matrix .row-label{background:#f9f9f9;white-space:nowrap;position:sticky;left:0;z-index:1;}"
-                ".matrix .cell{width:24px;height:18px;border:1px solid var(--border);}"
-                ".matrix .cell-empty{background:#fff;border:1px solid #eee;}"
-                ".matrix .cell-link{display:block;width:100%;height:100%;text-decoration:none;}"
-                ".legend{margin-top:8px;display:flex;gap:12px;align-items:center;font-size:13px;}"
-                ".legend-item{display:flex;gap:6px;align-items:center;}"
-                ".legend-swatch{width:18px;height:12px;border:1px solid var(--border);}"
-                "</style>",
-                "</head><body>"]
-        # add modal/lightbox HTML + JS so data:image thumbnails open in a popup
-        html.append('''
-<div id="imgModal" style="display:none;position:fixed;z-index:9999;left:0;top:0;width:100%;height:100%;overflow:auto;background-color:rgba(0,0,0,0.8);text-align:center;">
-    <span style="position:absolute;right:20px;top:20px;color:#fff;font-size:30px;cursor:pointer;" onclick="document.getElementById('imgModal').style.display='none'">&times;</span>
-    <img id="imgModalImg" src="" style="max-width:90%;max-height:90%;margin-top:3%;cursor:pointer;" />
-</div>
-<script>
-// open data:image modal when clicking anchors to embedded images
-document.addEventListener('click', function(e){
-    var a = e.target.closest && e.target.closest('a');
-    if(!a) return;
-    var href = a.getAttribute && a.getAttribute('href');
-    if(href && href.indexOf('data:image') === 0){
-        e.preventDefault();
-        var img = document.getElementById('imgModalImg');
-        img.src = href;
-        document.getElementById('imgModal').style.display = 'block';
-    }
-});
-// clicking the full image closes the modal
-document.getElementById('imgModalImg').addEventListener('click', function(){
-    document.getElementById('imgModal').style.display = 'none';
-});
-</script>
-''')
-        html.append("<h1>Steam Emulator Test Report</h1>")
+        tested_ids, vid_to_results = self._tested_version_index()
+        # (version, seconds spent testing it, comma-separated packages) in display
+        # order; every section below walks this list. Seconds include the running
+        # timer if active.
+        tested_versions = [
+            (v,
+             int(timing.get(v['id'], 0)) + (running_extra if running_vid == v['id'] else 0),
+             ', '.join(v.get('packages') or ()))
+            for v in get_active_versions() if v['id'] in tested_ids
+        ]
+        total_all = sum(sec for _, sec, _ in tested_versions)
+
+        buf = io.StringIO() if out is None else out
+        write = buf.write
+        write(REPORT_HEAD_HTML)
+        write(REPORT_MODAL_HTML)
+        write("<h1>Steam Emulator Test Report</h1>\n")
         # include total testing time next to the generated timestamp
-        html.append(f"<p class='meta'><strong>Tester:</strong> {meta.get('tester','')} &nbsp; <strong>Commit:</strong> {meta.get('commit','')} &nbsp; <strong>Report Generated:</strong> {now} &nbsp; <strong>Total testing time:</strong> {self.format_seconds(total_all)}</p>")
-        html.append(f"<p class='meta'><strong>Test Type:</strong> " + ("WAN" if meta.get('WAN') else "") + (" / " if meta.get('WAN') and meta.get('LAN') else "") + ("LAN" if meta.get('LAN') else "") + "</p>")
+        write(f"<p class='meta'><strong>Tester:</strong> {meta.get('tester','')} &nbsp; <strong>Commit:</strong> {meta.get('commit','')} &nbsp; <strong>Report Generated:</strong> {now} &nbsp; <strong>Total testing time:</strong> {self.format_seconds(total_all)}</p>\n")
+        test_type = " / ".join(t for t in ("WAN", "LAN") if meta.get(t))
+        write(f"<p class='meta'><strong>Test Type:</strong> {test_type}</p>\n")
 
-        def anchor_id(value):
-            return re.sub(r'[^a-zA-Z0-9_-]+', '-', str(value)).strip('-').lower()
+        # nothing tested yet: skip the empty matrix, legend and expand/collapse controls
+        if not tested_versions:
+            write("<p class='meta'>No versions tested yet.</p>\n")
+            write('</body></html>')
+            return buf.getvalue() if out is None else None
 
         # build summary matrix chart (placed above version details)
         # columns: union of tests across all tested versions (respects templates)
@@ -3993,32 +5063,28 @@ document.getElementById('imgModalImg').addEventListener('click', function(){
 
         # Collect tests for each version and build union for matrix columns
         version_tests_cache = {}  # vid -> list of (test_key, name, desc)
-        all_test_keys_ordered = []  # maintains order of first appearance
-        all_test_names = {}
+        version_test_keys = {}  # vid -> frozenset of the test keys in version_tests_cache[vid]
+        all_test_names = {}  # test_key -> name, in order of first appearance
 
-        for v in get_active_versions():
+        for v, _, _ in tested_versions:
             vid = v['id']
-            if vid not in tested_ids:
-                continue
 
             # Try to get version-specific tests from API/cache (template-filtered)
             version_tests, _ = self.get_tests_for_version(vid)
             if version_tests:
                 version_tests_cache[vid] = version_tests
+                version_test_keys[vid] = frozenset(t[0] for t in version_tests)
                 for tk, tn, td in version_tests:
-                    if tk not in all_test_names:
-                        all_test_keys_ordered.append(tk)
-                        all_test_names[tk] = tn
+                    all_test_names.setdefault(tk, tn)
             else:
                 # Fallback to global TESTS
                 version_tests_cache[vid] = TESTS
+                version_test_keys[vid] = frozenset(t[0] for t in TESTS)
                 for tk, tn, td in TESTS:
-                    if tk not in all_test_names:
-                        all_test_keys_ordered.append(tk)
-                        all_test_names[tk] = tn
+                    all_test_names.setdefault(tk, tn)
 
         # Use ordered union for matrix columns, fallback to TESTS if empty
-        test_cols = all_test_keys_ordered if all_test_keys_ordered else [t[0] for t in TESTS]
+        test_cols = list(all_test_names) if all_test_names else [t[0] for t in TESTS]
         test_names = all_test_names if all_test_names else {t[0]: t[1] for t in TESTS}
 
         # color mapping
@@ -4030,81 +5096,66 @@ document.getElementById('imgModalImg').addEventListener('click', function(){
             'SKIP': '#95a5a6'
         }
 
-        matrix = ['<h2>Test Matrix Overview</h2>']
-        matrix.append('<div class="matrix-wrap">')
-        matrix.append('<table class="matrix">')
+        write('<h2>Test Matrix Overview</h2>\n')
+        write('<div class="matrix-wrap">\n')
+        write('<table class="matrix">\n')
         # header row
-        header_cells = ['<th>Packages</th>']
+        write('<tr><th>Packages</th>')
         for tc in test_cols:
             label = html_lib.escape(f"{tc} {test_names.get(tc,'')}")
-            header_cells.append(f'<th style="white-space:nowrap;">{label}</th>')
-        matrix.append('<tr>' + ''.join(header_cells) + '</tr>')
-
-        for v in get_active_versions():
+            write(f'<th style="white-space:nowrap;">{label}</th>')
+        write('</tr>\n')
+
+        test_anchors = {tc: report_anchor_id(tc) for tc in test_cols}
+        # cell titles are '<vid> - Test <tc>'; escaped per version and per column, not per cell
+        test_titles = {tc: f" - Test {html_lib.escape(tc)}" for tc in test_cols}
+        # per-status opening <td> of a matrix cell; '' is an untested cell
+        cell_open = {st: f'<td class="cell" style="background:{color};">' for st, color in color_map.items()}
+        cell_open[''] = '<td class="cell cell-empty">'
+        unknown_cell_open = '<td class="cell" style="background:#ffffff;">'
+        skip_cell = f'<td class="cell" style="background:{color_map["SKIP"]};"></td>'
+        for v, _, packages in tested_versions:
             vid = v['id']
-            if vid not in tested_ids:
-                continue
-            packages = v.get('packages', [])
-            row_label = ', '.join(packages) if packages else vid
-            ver_anchor = anchor_id(vid)
-            row = [f'<td class="row-label">{html_lib.escape(row_label)}</td>']
+            row_label = packages or vid
+            ver_anchor = report_anchor_id(vid)
+            vid_title = html_lib.escape(vid)
+            write(f'<tr><td class="row-label">{html_lib.escape(row_label)}</td>')
             saved = vid_to_results.get(vid, {})
-            # Get tests applicable to this version (from template)
-            version_test_keys = set(t[0] for t in version_tests_cache.get(vid, TESTS))
+            # Tests applicable to this version (from template)
+            test_keys = version_test_keys[vid]
             for tc in test_cols:
                 # Treat tests not in version's template as skipped
-                if tc not in version_test_keys:
-                    color = color_map.get('SKIP')
-                    cell = f'<td class="cell" style="background:{color};"></td>'
-                else:
-                    st = saved.get(tc, {}).get('status', '')
-                    row_anchor = f"test-{ver_anchor}-{anchor_id(tc)}"
-                    title = html_lib.escape(f"{vid} - Test {tc}")
-                    if not st:
-                        cell = f'<td class="cell cell-empty"><a class="cell-link" href="#{row_anchor}" title="{title}"></a></td>'
-                    else:
-                        color = color_map.get(st, '#ffffff')
-                        cell = f'<td class="cell" style="background:{color};"><a class="cell-link" href="#{row_anchor}" title="{title}"></a></td>'
-                row.append(cell)
-            matrix.append('<tr>' + ''.join(row) + '</tr>')
-
-        matrix.append('</table>')
-        matrix.append('</div>')
-
-        # legend
-        legend = ['<div class="legend">']
-        legend.append('<div class="legend-item"><div class="legend-swatch" style="background:#3498db"></div><div>Working</div></div>')
-        legend.append('<div class="legend-item"><div class="legend-swatch" style="background:#f1c40f"></div><div>Semi-working</div></div>')
-        legend.append('<div class="legend-item"><div class="legend-swatch" style="background:#e74c3c"></div><div>Not working</div></div>')
-        legend.append('<div class="legend-item"><div class="legend-swatch" style="background:#95a5a6"></div><div>N/A / Skipped</div></div>')
-        legend.append('</div>')
-
-        html.extend(matrix)
-        html.extend(legend)
-        html.append("<div style='margin:10px 0;'>"
-                    "<button type='button' onclick='setAllVersions(true)'>Expand all</button> "
-                    "<button type='button' onclick='setAllVersions(false)'>Collapse all</button>"
-                    "</div>")
-        html.append("<script>"
-                    "function setAllVersions(open){"
-                    "var nodes=document.querySelectorAll('details.version');"
-                    "nodes.forEach(function(d){d.open=open;});"
-                    "}"
-                    "</script>")
-        for v in get_active_versions():
+                if tc not in test_keys:
+                    write(skip_cell)
+                    continue
+                st = saved.get(tc, {}).get('status', '')
+                write(cell_open.get(st, unknown_cell_open))
+                write(f'<a class="cell-link" href="#test-{ver_anchor}-{test_anchors[tc]}" title="{vid_title}{test_titles[tc]}"></a></td>')
+            write('</tr>\n')
+
+        write('</table>\n')
+        write('</div>\n')
+
+        write(REPORT_LEGEND_HTML)
+
+        write("<div style='margin:10px 0;'>"
+              "<button type='button' onclick='setAllVersions(true)'>Expand all</button> "
+              "<button type='button' onclick='setAllVersions(false)'>Collapse all</button>"
+              "</div>\n")
+        write("<script>"
+              "function setAllVersions(open){"
+              "var nodes=document.querySelectorAll('details.version');"
+              "nodes.forEach(function(d){d.open=open;});"
+              "}"
+              "</script>\n")
+        for v, sec, packages in tested_versions:
             vid = v['id']
-            if vid not in tested_ids:
-                continue
-            # time for this version
-            sec = int(timing.get(vid, 0))
-            if running_vid == vid:
-                sec += running_extra
-            ver_anchor = anchor_id(vid)
-            html.append(f"<details class='version'><summary id='ver-{ver_anchor}'>{vid}</summary>")
-            html.append(f"<p class='meta'><strong>Packages:</strong> {', '.join(v.get('packages',[]))} &nbsp; <strong>steam_date:</strong> {v.get('steam_date')} &nbsp; <strong>steam_time:</strong> {v.get('steam_time')}</p>")
-            html.append(f"<p class='meta'><strong>Time spent testing:</strong> {self.format_seconds(sec)}</p>")
-            html.append('<table>')
-            html.append('<tr><th>Test #</th><th>Test</th><th>Expected</th><th>Status</th><th>Notes</th></tr>')
+            ver_anchor = report_anchor_id(vid)
+            write(f"<details class='version'><summary id='ver-{ver_anchor}'>{vid}</summary>\n")
+            write(f"<p class='meta'><strong>Packages:</strong> {packages} &nbsp; <strong>steam_date:</strong> {v.get('steam_date')} &nbsp; <strong>steam_time:</strong> {v.get('steam_time')}</p>\n")
+            write(f"<p class='meta'><strong>Time spent testing:</strong> {self.format_seconds(sec)}</p>\n")
+            write('<table>\n')
+            write('<tr><th>Test #</th><th>Test</th><th>Expected</th><th>Status</th><th>Notes</th></tr>\n')
             saved = vid_to_results.get(vid, {})
             # Use version-specific tests from cache (respects templates)
             version_test_list = version_tests_cache.get(vid, TESTS)
@@ -4114,7 +5165,8 @@ document.getElementById('imgModalImg').addEventListener('click', function(){
                 status = r.get('status', '')
                 raw_notes = r.get('notes', '') or ''
                 # convert old thumbnail format (separate thumb image) to new format (resized full image)
-                raw_notes = convert_old_thumbnail_format(raw_notes)
+                if 'data:image' in raw_notes:
+                    raw_notes = convert_old_thumbnail_format(raw_notes)
                 # Convert markdown code blocks (```) to <pre><code> for HTML export
                 if '```' in raw_notes:
                     raw_notes = convert_markdown_code_blocks_to_html(raw_notes)
@@ -4125,115 +5177,35 @@ document.getElementById('imgModalImg').addEventListener('click', function(){
                     raw_notes
                 )
                 # if notes appear to already be HTML (contains tags, code blocks, or embedded image), use directly
-                if '<img' in raw_notes or '<pre' in raw_notes or '<code' in raw_notes or '<p' in raw_notes or '<br' in raw_notes or '&lt;' in raw_notes:
+                if REPORT_HTML_NOTES_PATTERN.search(raw_notes):
                     notes = raw_notes
                 else:
                     # escape plain text and preserve newlines
-                    notes = html_lib.escape(raw_notes).replace('\n', '<br>')
-                row_anchor = f"test-{ver_anchor}-{anchor_id(tnum)}"
-                html.append(f"<tr id='{row_anchor}'><td>{tnum}</td><td>{tname}</td><td>{texp}</td><td>{status}</td><td><div class='notes'>{notes}</div></td></tr>")
-            html.append('</table>')
-            html.append('</details>')
-        html.append('</body></html>')
-        return '\n'.join(html)
+                    notes = raw_notes.translate(REPORT_NOTES_ESCAPE_TABLE)
+                row_anchor = f"test-{ver_anchor}-{report_anchor_id(tnum)}"
+                write(f"<tr id='{row_anchor}'><td>{tnum}</td><td>{tname}</td><td>{texp}</td><td>{status}</td><td><div class='notes'>{notes}</div></td></tr>\n")
+            write('</table>\n')
+            write('</details>\n')
+        write('</body></html>')
+        if out is None:
+            return buf.getvalue()
+        return None
 
     def _setup_keyboard_shortcuts(self):
-        """Set up global keyboard shortcuts for the application."""
-        # Navigation shortcuts
-        # Ctrl+1: Go to Intro page
-        shortcut_intro = QShortcut(QKeySequence("Ctrl+1"), self.window)
-        shortcut_intro.activated.connect(lambda: self.stack.setCurrentWidget(self.intro))
-
-        # Ctrl+2: Go to Versions page
-        shortcut_versions = QShortcut(QKeySequence("Ctrl+2"), self.window)
-        shortcut_versions.activated.connect(self.show_versions)
-
-        # Ctrl+3: Go to Tests page (if a version is selected)
-        shortcut_tests = QShortcut(QKeySequence("Ctrl+3"), self.window)
-        shortcut_tests.activated.connect(lambda: self.stack.setCurrentWidget(self.tests) if self.current_version else None)
-
-        # Ctrl+S: Save session
-        shortcut_save = QShortcut(QKeySequence("Ctrl+S"), self.window)
-        shortcut_save.activated.connect(self._shortcut_save)
-
-        # Ctrl+E: Export report
-        shortcut_export = QShortcut(QKeySequence("Ctrl+E"), self.window)
-        shortcut_export.activated.connect(self.export_report)
-
-        # Ctrl+U: Upload to panel
-        shortcut_upload = QShortcut(QKeySequence("Ctrl+U"), self.window)
-        shortcut_upload.activated.connect(self._shortcut_upload)
-
-        # Ctrl+R: Reload session
-        shortcut_reload = QShortcut(QKeySequence("Ctrl+R"), self.window)
-        shortcut_reload.activated.connect(self.load_session)
-
-        # Ctrl+T: Check retests
-        shortcut_retests = QShortcut(QKeySequence("Ctrl+T"), self.window)
-        shortcut_retests.activated.connect(self._shortcut_check_retests)
-
-        # F5: Reload/refresh current view
-        shortcut_refresh = QShortcut(QKeySequence("F5"), self.window)
-        shortcut_refresh.activated.connect(self._shortcut_refresh)
-
-        # Ctrl+F: Finish test (when on tests page)
-        shortcut_finish = QShortcut(QKeySequence("Ctrl+F"), self.window)
-        shortcut_finish.activated.connect(self._shortcut_finish_test)
-
-        # Escape: Go back / cancel
-        shortcut_back = QShortcut(QKeySequence("Escape"), self.window)
-        shortcut_back.activated.connect(self._shortcut_back)
-
-        # F1: Show keyboard shortcuts help
-        shortcut_help = QShortcut(QKeySequence("F1"), self.window)
-        shortcut_help.activated.connect(self._show_shortcuts_help)
-
-        # Ctrl+L: Attach log files (when on tests page)
-        shortcut_attach = QShortcut(QKeySequence("Ctrl+L"), self.window)
-        shortcut_attach.activated.connect(self._shortcut_attach_log)
-
-        # Alt+Up/Down: Navigate tests list when on versions page
-        shortcut_prev_version = QShortcut(QKeySequence("Alt+Up"), self.window)
-        shortcut_prev_version.activated.connect(self._shortcut_prev_version)
-
-        shortcut_next_version = QShortcut(QKeySequence("Alt+Down"), self.window)
-        shortcut_next_version.activated.connect(self._shortcut_next_version)
-
-        # Space/Enter: Start timer when on tests page
-        shortcut_timer = QShortcut(QKeySequence("Ctrl+Space"), self.window)
-        shortcut_timer.activated.connect(self._shortcut_toggle_timer)
-
-        # ==================== Test Status & Navigation Shortcuts ====================
-        # These shortcuts only work on the Tests page
-
-        # 1/2/3/4: Set test status (Working/Semi-working/Not working/N/A)
-        shortcut_status_1 = QShortcut(QKeySequence("1"), self.window)
-        shortcut_status_1.activated.connect(lambda: self._shortcut_set_status(1))
-
-        shortcut_status_2 = QShortcut(QKeySequence("2"), self.window)
-        shortcut_status_2.activated.connect(lambda: self._shortcut_set_status(2))
-
-        shortcut_status_3 = QShortcut(QKeySequence("3"), self.window)
-        shortcut_status_3.activated.connect(lambda: self._shortcut_set_status(3))
-
-        shortcut_status_4 = QShortcut(QKeySequence("4"), self.window)
-        shortcut_status_4.activated.connect(lambda: self._shortcut_set_status(4))
-
-        # Tab/Enter: Next test (only when not in text field)
-        shortcut_next_test = QShortcut(QKeySequence("Ctrl+Down"), self.window)
-        shortcut_next_test.activated.connect(self._shortcut_next_test)
-
-        # Also allow Enter for next test (common workflow)
-        shortcut_next_test_enter = QShortcut(QKeySequence("Ctrl+Return"), self.window)
-        shortcut_next_test_enter.activated.connect(self._shortcut_next_test)
-
-        # Shift+Tab: Previous test
-        shortcut_prev_test = QShortcut(QKeySequence("Ctrl+Up"), self.window)
-        shortcut_prev_test.activated.connect(self._shortcut_prev_test)
-
-        # Ctrl+N: Focus notes field for current test
-        shortcut_focus_notes = QShortcut(QKeySequence("Ctrl+N"), self.window)
-        shortcut_focus_notes.activated.connect(self._shortcut_focus_notes)
+        """Set up global keyboard shortcuts for the application from KEYBOARD_SHORTCUTS."""
+        for keys, handler_name, *args in self.KEYBOARD_SHORTCUTS:
+            handler = getattr(self, handler_name)
+            shortcut = QShortcut(QKeySequence(keys), self.window)
+            shortcut.activated.connect(functools.partial(handler, *args) if args else handler)
+
+    def _shortcut_goto_intro(self):
+        """Handle Ctrl+1 shortcut - go to the intro page."""
+        self.stack.setCurrentWidget(self.intro)
+
+    def _shortcut_goto_tests(self):
+        """Handle Ctrl+3 shortcut - go to the tests page if a version is selected."""
+        if self.current_version:
+            self.stack.setCurrentWidget(self.tests)
 
     def _shortcut_set_status(self, status_index):
         """Handle 1/2/3/4 shortcut - set test status."""
@@ -22,21 +22,25 @@ Usage:
 """
 
 import os
+import re
 import sys
 import json
-import threading
+import functools
 import logging
+import html as html_lib
 from urllib.parse import urlparse, urlunparse
-from typing import Optional, List, Callable, Any
+from typing import Optional, List, Dict, Tuple, Callable, Any
 from datetime import datetime
 from dataclasses import dataclass
 
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QThread, QMutex, QWaitCondition
+from PyQt5.QtCore import (QObject, pyqtSignal, QTimer, QThread, QMutex, QWaitCondition, QCoreApplication,
+                          QRunnable, QThreadPool)
 
 # Try to import the API client from the test tool directory
 try:
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from api_client import TestPanelClient, Config, RetestItem, SubmitResult, ReportLog, UserInfo, VersionsResult
+    from api_client import (TestPanelClient, Config, RetestItem, SubmitResult, ReportLog, UserInfo,
+                            VersionsResult, HashCheckResult)
 except ImportError:
     # Fallback: define minimal classes if import fails
     TestPanelClient = None
@@ -45,6 +49,8 @@ except ImportError:
     SubmitResult = None
     ReportLog = None
     UserInfo = None
+    VersionsResult = None
+    HashCheckResult = None
 
 # Configure logging
 logging.basicConfig(
@@ -62,6 +68,19 @@ API_URL_ENDPOINT_SUFFIXES = (
     '/api/notifications.php',
 )
 
+# Trailing '/api' or endpoint path stripped from a configured API URL, matched in one pass
+API_URL_SUFFIX_PATTERN = re.compile(
+    '(?:/api|%s)$' % '|'.join(re.escape(suffix) for suffix in API_URL_ENDPOINT_SUFFIXES),
+    re.IGNORECASE
+)
+
+# Config file found by PanelIntegration._find_config_file, keyed by (cwd, tool dir);
+# None records that no config file exists there
+_CONFIG_PATH_CACHE: Dict[Tuple[str, str], Optional[str]] = {}
+
+# Settings parsed from each loaded config file: path -> (st_mtime_ns, Config.to_dict())
+_CONFIG_CACHE: Dict[str, Tuple[int, dict]] = {}
+
 
 def normalize_api_url(api_url: str) -> str:
     """Normalize API base URL and strip any trailing endpoint path."""
@@ -70,26 +89,30 @@ def normalize_api_url(api_url: str) -> str:
     value = api_url.strip()
     if not value:
         return ''
+    return _normalize_api_url_cached(value)
+
 
+@functools.lru_cache(maxsize=256)
+def _normalize_api_url_cached(value: str) -> str:
+    """Normalize a stripped, non-empty API URL (memoized; see normalize_api_url)."""
     parsed = urlparse(value)
     if not parsed.scheme:
         parsed = urlparse(f"https://{value}")
 
     path = (parsed.path or '').rstrip('/')
-    lower_path = path.lower()
-    if lower_path.endswith('/api'):
-        path = path[:-4]
-    else:
-        for suffix in API_URL_ENDPOINT_SUFFIXES:
-            if lower_path.endswith(suffix):
-                path = path[:-len(suffix)]
-                break
+    match = API_URL_SUFFIX_PATTERN.search(path)
+    if match:
+        path = path[:match.start()]
     path = path.rstrip('/')
 
     return urlunparse((parsed.scheme, parsed.netloc, path, '', '', ''))
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular instances
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RetestNotification:
     """A retest notification to display to the user."""
     type: str  # 'retest' or 'fixed'
@@ -104,6 +127,13 @@ class RetestNotification:
     report_revision: Optional[int] = None  # Report revision when retest was requested
     tested_commit_hash: Optional[str] = None  # Commit hash the test was originally submitted against
 
+    @classmethod
+    def from_item(cls, item: 'RetestItem') -> 'RetestNotification':
+        """Build a notification from an API RetestItem (fields passed positionally)."""
+        return cls(item.type, item.test_key, item.test_name, item.client_version,
+                   item.reason, item.latest_revision, item.commit_hash, item.notes,
+                   item.report_id, item.report_revision, item.tested_commit_hash)
+
 
 class ApiWorker(QThread):
     """
@@ -257,6 +287,12 @@ class ApiWorker(QThread):
                 success = self._client.acknowledge_flag(flag_type, flag_id)
                 self.acknowledge_result.emit(operation_id, success, None)
 
+            elif operation == 'acknowledge_flags':
+                flag_type = kwargs.get('flag_type')
+                flag_ids = kwargs.get('flag_ids')
+                success = self._client.acknowledge_flags(flag_type, flag_ids)
+                self.acknowledge_result.emit(operation_id, success, None)
+
             elif operation == 'check_hashes':
                 hashes = kwargs.get('hashes')
                 test_type = kwargs.get('test_type')
@@ -283,6 +319,20 @@ class ApiWorker(QThread):
             self.error_occurred.emit(operation_id, str(e))
 
 
+class SubmitTask(QRunnable):
+    """Run a background PanelIntegration.submit_session() on a pool thread."""
+
+    def __init__(self, panel, session_file: str, queue_if_offline: bool = True):
+        super().__init__()
+        self.panel = panel
+        self.session_file = session_file
+        self.queue_if_offline = queue_if_offline
+
+    def run(self):
+        # submission_complete is emitted from here and queued to receivers on the GUI thread
+        self.panel._async_submit(self.session_file, self.queue_if_offline)
+
+
 class PanelIntegration(QObject):
     """
     Integrates the Test Panel API with the PyQt5 test tool.
@@ -340,7 +390,12 @@ class PanelIntegration(QObject):
         self._config_path: Optional[str] = None
         self._check_timer: Optional[QTimer] = None
         self._check_interval = 600  # 10 minutes in seconds
+        # Current timer period; doubles after each empty retest check, up to _max_check_interval
+        self._current_check_interval = self._check_interval
+        self._max_check_interval = 3600  # 1 hour in seconds
         self._last_retests: List[RetestNotification] = []
+        self._last_retest_fingerprint: Optional[tuple] = None  # Queue last emitted via retest_notification
+        self._retest_etag: Optional[str] = None  # ETag of the last periodic retest queue response
         self._is_monitoring = False
         self._offline_mode = False  # When True, all API calls are blocked until restart
 
@@ -349,6 +404,11 @@ class PanelIntegration(QObject):
         self._operation_counter = 0  # For generating unique operation IDs
         self._pending_callbacks = {}  # Maps operation_id to callback function
 
+        # Release pooled API connections when the application exits
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
         # Only try to load config automatically if explicitly requested
         if auto_load_config:
             self._auto_load_config()
@@ -359,6 +419,9 @@ class PanelIntegration(QObject):
         cwd = os.getcwd()
         # Get the test tool directory (where the module file is located)
         tool_dir = os.path.dirname(os.path.abspath(__file__))
+        cache_key = (os.path.normpath(cwd), os.path.normpath(tool_dir))
+        if cache_key in _CONFIG_PATH_CACHE:
+            return _CONFIG_PATH_CACHE[cache_key]
 
         # Search locations - prioritize current working directory
         search_paths = [
@@ -378,13 +441,32 @@ class PanelIntegration(QObject):
                 seen.add(normalized)
                 unique_paths.append(p)
 
+        # One directory listing per location instead of an isfile() probe per filename;
+        # normcase keeps matching case-insensitive where the filesystem is (Windows)
+        priority = {os.path.normcase(name): i for i, name in enumerate(self.CONFIG_FILENAMES)}
+        found = None
         for directory in unique_paths:
-            for filename in self.CONFIG_FILENAMES:
-                path = os.path.join(directory, filename)
-                if os.path.isfile(path):
-                    return path
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                matches = [
+                    (priority[os.path.normcase(entry.name)], entry.name)
+                    for entry in entries
+                    if os.path.normcase(entry.name) in priority and entry.is_file()
+                ]
+            if matches:
+                found = os.path.join(directory, min(matches)[1])
+                break
 
-        return None
+        _CONFIG_PATH_CACHE[cache_key] = found
+        return found
+
+    @staticmethod
+    def invalidate_config_cache() -> None:
+        """Forget previously discovered config file locations."""
+        _CONFIG_PATH_CACHE.clear()
 
     def _auto_load_config(self) -> bool:
         """Try to automatically load config from standard locations."""
@@ -430,6 +512,11 @@ class PanelIntegration(QObject):
         if self._client:
             self._worker.set_client(self._client)
 
+    def shutdown(self):
+        """Close the API client's HTTP connections (called on application exit)."""
+        if self._client:
+            self._client.close()
+
     def _stop_worker(self):
         """Stop the background worker thread."""
         if self._worker:
@@ -513,26 +600,38 @@ class PanelIntegration(QObject):
         callback = self._pending_callbacks.pop(operation_id, None)
         if callback:
             callback(success, result)
-        if success and result:
-            # Convert to notification objects
-            notifications = [
-                RetestNotification(
-                    type=item.type,
-                    test_key=item.test_key,
-                    test_name=item.test_name,
-                    client_version=item.client_version,
-                    reason=item.reason,
-                    latest_revision=item.latest_revision,
-                    commit_hash=item.commit_hash,
-                    notes=item.notes,
-                    report_id=item.report_id,
-                    report_revision=item.report_revision,
-                    tested_commit_hash=item.tested_commit_hash
-                )
-                for item in result
-            ]
-            self._last_retests = notifications
-            self.retest_notification.emit(notifications)
+        if success:
+            self._notify_retests(result or [])
+
+    def _notify_retests(self, items) -> bool:
+        """
+        Emit retest_notification for a fetched retest queue.
+
+        Nothing is emitted when the queue is identical to the one last
+        emitted, so periodic checks don't re-show an unchanged queue.
+
+        Returns:
+            True if a notification was emitted
+        """
+        if not items:
+            # forget the last queue so the same retests reappearing are reported again
+            self._last_retest_fingerprint = None
+            return False
+        fingerprint = tuple(
+            (item.type, item.id, item.test_key, item.client_version, item.reason,
+             item.latest_revision, item.commit_hash, item.notes, item.report_id,
+             item.report_revision, item.tested_commit_hash)
+            for item in items
+        )
+        if fingerprint == self._last_retest_fingerprint:
+            return False
+        self._last_retest_fingerprint = fingerprint
+
+        # Convert to notification objects
+        notifications = list(map(RetestNotification.from_item, items))
+        self._last_retests = notifications
+        self.retest_notification.emit(notifications)
+        return True
 
     def _on_generic_result(self, operation_id: str, success: bool, result):
         """Handle generic operation result from worker."""
@@ -810,6 +909,33 @@ class PanelIntegration(QObject):
 
         self._worker.queue_task('acknowledge_flag', operation_id, flag_type=flag_type, flag_id=flag_id)
 
+    def acknowledge_flags_async(self, flag_type: str, flag_ids: List[int],
+                                 callback: Callable[[bool, Any], None] = None):
+        """
+        Acknowledge several flags of one type in a single request asynchronously (non-blocking).
+
+        Args:
+            flag_type: 'retest' or 'fixed'
+            flag_ids: The flags' IDs
+            callback: Optional callback function(success, result)
+        """
+        if self._offline_mode:
+            if callback:
+                callback(False, None)
+            return
+
+        if not self.is_configured:
+            if callback:
+                callback(False, None)
+            return
+
+        self._ensure_worker()
+        operation_id = self._get_operation_id()
+        if callback:
+            self._pending_callbacks[operation_id] = callback
+
+        self._worker.queue_task('acknowledge_flags', operation_id, flag_type=flag_type, flag_ids=list(flag_ids))
+
     def check_hashes_async(self, hashes: dict, test_type: str,
                            commit_hash: str = None, callback: Callable[[bool, Any], None] = None):
         """
@@ -827,13 +953,11 @@ class PanelIntegration(QObject):
         """
         if self._offline_mode:
             if callback:
-                from api_client import HashCheckResult
                 callback(False, HashCheckResult(success=False, error="Offline mode"))
             return
 
         if not self.is_configured:
             if callback:
-                from api_client import HashCheckResult
                 callback(False, HashCheckResult(success=False, error="Not configured"))
             return
 
@@ -878,6 +1002,36 @@ class PanelIntegration(QObject):
 
         self._worker.queue_task('get_retest_queue', operation_id, client_version=client_version)
 
+    def find_report_id_async(self, client_version: str, test_type: str,
+                             callback: Callable[[bool, Any], None] = None):
+        """
+        Find the report ID for a client version and test type asynchronously (non-blocking).
+
+        Args:
+            client_version: The client version ID
+            test_type: The test type (WAN or LAN)
+            callback: Optional callback function(success, result).
+                      success is False with result None when no report exists,
+                      or with an error string when the request failed.
+        """
+        if self._offline_mode:
+            if callback:
+                callback(False, "Offline mode - restart to reconnect")
+            return
+
+        if not self.is_configured:
+            if callback:
+                callback(False, "Not configured")
+            return
+
+        self._ensure_worker()
+        operation_id = self._get_operation_id()
+        if callback:
+            self._pending_callbacks[operation_id] = callback
+
+        self._worker.queue_task('find_report_id', operation_id,
+                                client_version=client_version, test_type=test_type)
+
     def load_config(self, path: str) -> bool:
         """
         Load configuration from a file.
@@ -893,7 +1047,14 @@ class PanelIntegration(QObject):
             return False
 
         try:
-            self._client = TestPanelClient.from_config_file(path)
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(path)
+            if cached and cached[0] == mtime_ns:
+                # unchanged since last load: skip re-reading and re-parsing the file
+                self._client = TestPanelClient(Config.from_dict(cached[1]))
+            else:
+                self._client = TestPanelClient.from_config_file(path)
+                _CONFIG_CACHE[path] = (mtime_ns, self._client.config.to_dict())
             self._config_path = path
             self._check_interval = self._client.config.check_interval
             logger.info(f"Config loaded from: {path}")
@@ -904,7 +1065,8 @@ class PanelIntegration(QObject):
         except ValueError as e:
             logger.error(f"Invalid config: {e}")
             return False
-        except Exception as e:
+        except (OSError, AttributeError) as e:
+            # unreadable file, or JSON that isn't a settings object
             logger.error(f"Error loading config: {e}")
             return False
 
@@ -933,7 +1095,6 @@ class PanelIntegration(QObject):
 
         # Create client directly with the provided settings
         try:
-            from api_client import Config
             config = Config(
                 api_url=api_url.rstrip('/'),
                 api_key=api_key,
@@ -944,7 +1105,8 @@ class PanelIntegration(QObject):
             self._client = TestPanelClient(config)
             self._check_interval = config.check_interval
             logger.info(f"Panel configured with API URL: {api_url}")
-        except Exception as e:
+        except ValueError as e:
+            # raised by TestPanelClient for settings that fail Config.validate()
             logger.error(f"Error creating client: {e}")
             return None
 
@@ -962,8 +1124,22 @@ class PanelIntegration(QObject):
                 'timeout': 30
             }
 
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2)
+            # Write a sibling temp file in one go and move it into place, so an
+            # interrupted save never leaves a truncated config behind
+            payload = json.dumps(config_data, indent=2).encode('utf-8')
+            tmp_path = path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            _CONFIG_CACHE.pop(path, None)
+            self.invalidate_config_cache()
 
             logger.info(f"Config saved to: {path}")
             self._config_path = path
@@ -1055,14 +1231,15 @@ class PanelIntegration(QObject):
         # Stop any existing timer
         self.stop_monitoring()
 
-        # Do immediate check
-        self._check_for_retests()
-
         # Setup periodic timer (QTimer runs on the main thread)
+        self._current_check_interval = self._check_interval
         self._check_timer = QTimer(self)
         self._check_timer.timeout.connect(self._check_for_retests)
         self._check_timer.start(self._check_interval * 1000)  # Convert to ms
 
+        # Do immediate check (may already back off the timer if nothing is queued)
+        self._check_for_retests()
+
         self._is_monitoring = True
         logger.info(f"Started monitoring (interval: {self._check_interval}s)")
 
@@ -1083,33 +1260,37 @@ class PanelIntegration(QObject):
             return
 
         try:
-            items = self._client.get_retest_queue()
-
-            if items:
-                # Convert to notification objects
-                notifications = [
-                    RetestNotification(
-                        type=item.type,
-                        test_key=item.test_key,
-                        test_name=item.test_name,
-                        client_version=item.client_version,
-                        reason=item.reason,
-                        latest_revision=item.latest_revision,
-                        commit_hash=item.commit_hash,
-                        notes=item.notes,
-                        report_id=item.report_id,
-                        report_revision=item.report_revision,
-                        tested_commit_hash=item.tested_commit_hash
-                    )
-                    for item in items
-                ]
-
-                self._last_retests = notifications
-                self.retest_notification.emit(notifications)
-                logger.info(f"Found {len(notifications)} pending retest(s)")
+            items, self._retest_etag = self._client.get_retest_queue_if_changed(self._retest_etag)
+            if items is None:
+                # 304 Not Modified: same queue as the last check, nothing to rebuild or emit
+                self._update_check_interval(self._last_retest_fingerprint is not None)
+                return
+
+            if self._notify_retests(items):
+                logger.info(f"Found {len(items)} pending retest(s)")
+            self._update_check_interval(bool(items))
         except Exception as e:
             logger.error(f"Error checking retests: {e}")
 
+    def _update_check_interval(self, found: bool):
+        """
+        Back off the monitoring timer while the retest queue stays empty.
+
+        Each empty check doubles the period (capped at _max_check_interval);
+        finding retests resets it to the configured check interval.
+        """
+        if found:
+            interval = self._check_interval
+        else:
+            interval = min(self._current_check_interval * 2,
+                           max(self._max_check_interval, self._check_interval))
+        if interval == self._current_check_interval:
+            return
+        self._current_check_interval = interval
+        if self._check_timer:
+            self._check_timer.setInterval(interval * 1000)
+            logger.debug(f"Retest check interval now {interval}s")
+
     def check_retests_now(self) -> List[RetestNotification]:
         """
         Check for retests immediately (synchronously).
@@ -1120,15 +1301,19 @@ class PanelIntegration(QObject):
         self._check_for_retests()
         return self._last_retests
 
-    def check_flags_lightweight(self) -> dict:
+    def check_flags_lightweight(self, since: str = None) -> dict:
         """
         Lightweight flag check for periodic polling in background thread.
 
         This is designed to be called frequently without freezing the UI.
         Returns unacknowledged flags for the current user.
 
+        Args:
+            since: Etag from the previous result; an unchanged flag set comes
+                   back with 'unchanged' True and no flags
+
         Returns:
-            Dict with 'success', 'count', and 'flags' keys
+            Dict with 'success', 'count', 'flags', 'etag' and 'unchanged' keys
         """
         if self._offline_mode:
             return {'success': False, 'count': 0, 'flags': []}
@@ -1137,7 +1322,7 @@ class PanelIntegration(QObject):
             return {'success': False, 'count': 0, 'flags': []}
 
         try:
-            return self._client.check_flags()
+            return self._client.check_flags(since=since)
         except Exception as e:
             logger.debug(f"Flag check failed: {e}")
             return {'success': False, 'count': 0, 'flags': [], 'error': str(e)}
@@ -1186,11 +1371,9 @@ class PanelIntegration(QObject):
             HashCheckResult with per-version results
         """
         if self._offline_mode:
-            from api_client import HashCheckResult
             return HashCheckResult(success=False, error="Offline mode - restart to check hashes")
 
         if not self.is_configured:
-            from api_client import HashCheckResult
             return HashCheckResult(success=False, error="Not configured")
 
         return self._client.check_hashes(hashes, test_type, commit_hash)
@@ -1234,13 +1417,8 @@ class PanelIntegration(QObject):
             return SubmitResult(success=False, error=error)
 
         if async_submit:
-            # Submit in background thread
-            thread = threading.Thread(
-                target=self._async_submit,
-                args=(session_file, queue_if_offline),
-                daemon=True
-            )
-            thread.start()
+            # Submit on a pooled background thread
+            QThreadPool.globalInstance().start(SubmitTask(self, session_file, queue_if_offline))
             return None
         else:
             # Synchronous submit
@@ -1255,7 +1433,7 @@ class PanelIntegration(QObject):
             return SubmitResult(success=False, error=str(e))
 
     def _async_submit(self, session_file: str, queue_if_offline: bool = True):
-        """Background thread submission handler."""
+        """Background submission handler, run by SubmitTask."""
         result = self._do_submit(session_file, queue_if_offline)
 
         if result.success:
@@ -1288,22 +1466,7 @@ class PanelIntegration(QObject):
 
         try:
             items = self._client.get_retest_queue(client_version)
-            return [
-                RetestNotification(
-                    type=item.type,
-                    test_key=item.test_key,
-                    test_name=item.test_name,
-                    client_version=item.client_version,
-                    reason=item.reason,
-                    latest_revision=item.latest_revision,
-                    commit_hash=item.commit_hash,
-                    notes=item.notes,
-                    report_id=item.report_id,
-                    report_revision=item.report_revision,
-                    tested_commit_hash=item.tested_commit_hash
-                )
-                for item in items
-            ]
+            return list(map(RetestNotification.from_item, items))
         except Exception as e:
             logger.error(f"Error getting retests for version: {e}")
             return []
@@ -1637,7 +1800,7 @@ class PanelIntegration(QObject):
 
         try:
             return TestPanelClient.compress_log_file(file_path)
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Error compressing log file: {e}")
             return {}
 
@@ -1678,6 +1841,50 @@ def setup_panel_integration(controller) -> Optional[PanelIntegration]:
     return panel
 
 
+# Stylesheet and heading of the pending retests dialog
+RETEST_DIALOG_HEAD_HTML = """
+    <style>
+        .retest-item { margin-bottom: 15px; padding: 10px; background: #f5f5f5; border-radius: 5px; }
+        .retest-header { font-weight: bold; font-size: 14px; margin-bottom: 5px; }
+        .retest-meta { font-size: 12px; color: #666; }
+        .admin-notes { background: #fff3cd; border-left: 3px solid #ffc107; padding: 8px; margin-top: 8px; font-size: 12px; }
+        .admin-notes-label { font-weight: bold; color: #856404; font-size: 11px; text-transform: uppercase; }
+        .warning { color: #d32f2f; font-weight: bold; }
+    </style>
+    <h3>The following tests need retesting:</h3>
+    """
+
+
+def _retest_item_html(r: RetestNotification) -> str:
+    """Build the retest dialog block for one notification."""
+    icon = "🔄" if r.type == "retest" else "✅"
+    parts = [
+        f'<div class="retest-item">'
+        f'<div class="retest-header">{icon} Test {r.test_key}: {r.test_name}</div>'
+        f'<div class="retest-meta">'
+        f'Version: {r.client_version}<br>'
+        f'Reason: {r.reason}'
+    ]
+    if r.report_id:
+        revision_info = f" (revision {r.report_revision})" if r.report_revision is not None else ""
+        parts.append(f'<br>Report ID: #{r.report_id}{revision_info}')
+    if r.tested_commit_hash is not None:
+        parts.append(f'<br><b>Test with commit revision: {r.tested_commit_hash}</b>')
+    if r.latest_revision:
+        parts.append('<br><span class="warning">⚠️ Please use latest emulator revision</span>')
+    if r.commit_hash:
+        parts.append(f'<br>Fix commit: <code>{r.commit_hash}</code>')
+    parts.append('</div>')
+
+    # Display admin notes if present, escaped and with newlines as line breaks
+    if r.notes:
+        notes_html = html_lib.escape(r.notes, quote=False).replace('\n', '<br>')
+        parts.append(f'<div class="admin-notes"><div class="admin-notes-label">📝 Admin Notes:</div>{notes_html}</div>')
+
+    parts.append('</div>')
+    return ''.join(parts)
+
+
 # Example callback handler for the test tool
 def show_retest_dialog(retests: List[RetestNotification], parent=None):
     """
@@ -1688,7 +1895,7 @@ def show_retest_dialog(retests: List[RetestNotification], parent=None):
         retests: List of RetestNotification objects
         parent: Parent widget for the dialog
     """
-    from PyQt5.QtWidgets import QMessageBox, QTextEdit, QVBoxLayout, QDialog, QPushButton, QHBoxLayout
+    from PyQt5.QtWidgets import QTextEdit, QVBoxLayout, QDialog, QPushButton, QHBoxLayout
 
     if not retests:
         return
@@ -1702,50 +1909,7 @@ def show_retest_dialog(retests: List[RetestNotification], parent=None):
     text = QTextEdit()
     text.setReadOnly(True)
 
-    # Build HTML content with admin notes
-    html = """
-    <style>
-        .retest-item { margin-bottom: 15px; padding: 10px; background: #f5f5f5; border-radius: 5px; }
-        .retest-header { font-weight: bold; font-size: 14px; margin-bottom: 5px; }
-        .retest-meta { font-size: 12px; color: #666; }
-        .admin-notes { background: #fff3cd; border-left: 3px solid #ffc107; padding: 8px; margin-top: 8px; font-size: 12px; }
-        .admin-notes-label { font-weight: bold; color: #856404; font-size: 11px; text-transform: uppercase; }
-        .warning { color: #d32f2f; font-weight: bold; }
-    </style>
-    <h3>The following tests need retesting:</h3>
-    """
-
-    for r in retests:
-        icon = "🔄" if r.type == "retest" else "✅"
-        html += f'<div class="retest-item">'
-        html += f'<div class="retest-header">{icon} Test {r.test_key}: {r.test_name}</div>'
-        html += f'<div class="retest-meta">'
-        html += f'Version: {r.client_version}<br>'
-        html += f'Reason: {r.reason}'
-        if r.report_id:
-            revision_info = f" (revision {r.report_revision})" if r.report_revision is not None else ""
-            html += f'<br>Report ID: #{r.report_id}{revision_info}'
-        if r.tested_commit_hash is not None:
-            html += f'<br><b>Test with commit revision: {r.tested_commit_hash}</b>'
-        if r.latest_revision:
-            html += '<br><span class="warning">⚠️ Please use latest emulator revision</span>'
-        if r.commit_hash:
-            html += f'<br>Fix commit: <code>{r.commit_hash}</code>'
-        html += '</div>'
-
-        # Display admin notes if present
-        if r.notes:
-            html += '<div class="admin-notes">'
-            html += '<div class="admin-notes-label">📝 Admin Notes:</div>'
-            # Escape HTML and convert newlines
-            notes_escaped = r.notes.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            notes_html = notes_escaped.replace('\n', '<br>')
-            html += f'{notes_html}'
-            html += '</div>'
-
-        html += '</div>'
-
-    text.setHtml(html)
+    text.setHtml(RETEST_DIALOG_HEAD_HTML + ''.join(map(_retest_item_html, retests)))
     layout.addWidget(text)
 
     # Add OK button